@@ -202,11 +202,14 @@ async def index_content(request: IndexRequest, background_tasks: BackgroundTasks
         # Get content chunks
         chunks = list(source.iter_content(request.entity_id))
         
-        # Process and index chunks in the background
+        # Process and index chunks in the background; nothing waits on the
+        # result, so don't wait for Qdrant to apply the upload either
         def process_and_index():
-            for chunk in chunks:
-                for processed in text_processor.process_chunk(chunk):
-                    vector_store.index_chunk(processed)
+            vector_store.index_chunks([
+                processed
+                for chunk in chunks
+                for processed in text_processor.process_chunk(chunk)
+            ], wait=False)
         
         background_tasks.add_task(process_and_index)
         return {"status": "indexing", "chunk_count": len(chunks)}
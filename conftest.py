@@ -0,0 +1,16 @@
+"""Root pytest configuration.
+
+Its presence makes pytest put the project root on sys.path, so tests can
+import the top-level packages directly. Fixtures here apply to every
+test suite.
+"""
+import pytest
+
+from utils.env import clear_env_cache
+
+@pytest.fixture(autouse=True)
+def clear_env_vars():
+    """Drop cached environment values so monkeypatched variables are seen."""
+    clear_env_cache()
+    yield
+    clear_env_cache()
@@ -23,18 +23,12 @@ def write_document_op(context: dagster.OpExecutionContext, collection: str) -> N
         return
 
     # Write the document
-    url = f"{client.api_url}/api/v1/documents"
-    response = requests.post(
-        url,
-        headers=client.headers,
-        json={
-            "collection": collection,
-            "text": "hello ping",
-            "metadata": {"test": True}
-        }
+    response = client.add_document(
+        collection=collection,
+        text="hello ping",
+        metadata={"test": True}
     )
-    response.raise_for_status()
-    context.log.info(f"Wrote document: {response.json()}")
+    context.log.info(f"Wrote document: {response}")
 
 def verify_document_op(context: dagster.OpExecutionContext, collection: str) -> None:
     """Verify the document exists."""
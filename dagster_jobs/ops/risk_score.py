@@ -175,7 +175,8 @@ def store_risk_score(context, supplier_id: str, risk_profile: Dict):
     
     # Store in feature store table
     # TODO: Replace with actual feature store implementation
-    with open('feature_store.features', 'a') as f:
+    feature_store_path = os.getenv('FEATURE_STORE_PATH', 'feature_store.features')
+    with open(feature_store_path, 'a') as f:
         f.write(f"{supplier_id}\t{score}\t{json.dumps(risk_profile)}\n")
     
     context.log.info(f"Stored risk profile for {supplier_id}: {risk_profile}")
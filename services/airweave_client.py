@@ -1,6 +1,6 @@
 """Airweave API client."""
 
-import requests
+import httpx
 from typing import Dict, Optional, Any
 
 from utils.env import get_env_var
@@ -13,6 +13,17 @@ class AirweaveClient:
         self.api_url = get_env_var("AIRWEAVE_API_URL", required=True)
         self.api_key = get_env_var("AIRWEAVE_API_KEY", required=True)
         self.headers = {"Authorization": f"Bearer {self.api_key}"}
+        # One pooled HTTP/2 connection shared by every call on this client
+        self._http = httpx.Client(
+            http2=True,
+            headers=self.headers,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            timeout=httpx.Timeout(30.0)
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._http.close()
 
     def search(self, collection: str, filter: Dict[str, Any], limit: int = 50) -> Dict[str, Any]:
         """Search documents in a collection.
@@ -26,12 +37,11 @@ class AirweaveClient:
             Search results as JSON
 
         Raises:
-            requests.exceptions.RequestException: If the request fails
+            httpx.HTTPError: If the request fails
         """
         url = f"{self.api_url}/api/v1/search"
-        response = requests.post(
+        response = self._http.post(
             url,
-            headers=self.headers,
             json={"collection": collection, "filter": filter, "limit": limit}
         )
         response.raise_for_status()
@@ -48,12 +58,11 @@ class AirweaveClient:
             Collection creation response
 
         Raises:
-            requests.exceptions.RequestException: If the request fails
+            httpx.HTTPError: If the request fails
         """
         url = f"{self.api_url}/api/v1/collections"
-        response = requests.post(
+        response = self._http.post(
             url,
-            headers=self.headers,
             json={"name": name, "dimensions": dimensions}
         )
         # Ignore 409 (already exists) errors
@@ -61,3 +70,25 @@ class AirweaveClient:
             return {"message": f"Collection '{name}' already exists"}
         response.raise_for_status()
         return response.json()
+
+    def add_document(self, collection: str, text: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Add a document to a collection.
+
+        Args:
+            collection: The collection name
+            text: The document text
+            metadata: Optional document metadata
+
+        Returns:
+            Document creation response
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        url = f"{self.api_url}/api/v1/documents"
+        response = self._http.post(
+            url,
+            json={"collection": collection, "text": text, "metadata": metadata or {}}
+        )
+        response.raise_for_status()
+        return response.json()
@@ -6,7 +6,7 @@ import json
 
 from qdrant_client import QdrantClient
 from qdrant_client.http.models import Filter, FieldCondition, MatchValue
-import redis
+import redis.asyncio as redis
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
@@ -161,18 +161,34 @@ class ContextProvider:
             return None
             
         cache_key = f"review:{supplier_id}:{evidence_hash}"
-        cached = self.redis.get(cache_key)
+        cached = await self.redis.get(cache_key)
         if cached:
             return json.loads(cached)
         return None
     
+    async def get_cached_reviews(
+        self,
+        supplier_ids: List[str],
+        evidence_hashes: List[str]
+    ) -> List[Optional[Dict]]:
+        """Get cached reviews for many suppliers in a single Redis round trip."""
+        if not self.redis:
+            return [None] * len(supplier_ids)
+            
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for supplier_id, evidence_hash in zip(supplier_ids, evidence_hashes):
+                pipe.get(f"review:{supplier_id}:{evidence_hash}")
+            results = await pipe.execute()
+        
+        return [json.loads(cached) if cached else None for cached in results]
+    
     async def cache_review(self, supplier_id: str, evidence_hash: str, review: Dict):
         """Cache a review result."""
         if not self.redis:
             return
             
         cache_key = f"review:{supplier_id}:{evidence_hash}"
-        self.redis.setex(
+        await self.redis.setex(
             cache_key,
             self.cache_ttl,
             json.dumps(review)
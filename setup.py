@@ -6,6 +6,6 @@ setup(
     install_requires=[
         "dagster>=1.5.0",
         "watchdog>=3.0.0",
-        "prometheus_client>=0.16.0",
+        "prometheus_client>=0.20.0",
     ],
 )
@@ -1,5 +1,19 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterator
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Keep-alive connection pool shared by all HTTP sources
+_SHARED_SESSION = requests.Session()
+_SHARED_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
 
 @dataclass
 class Chunk:
@@ -21,3 +35,21 @@ class BaseSource:
     def iter_content(self, entity_id: str) -> Iterator[Chunk]:
         """Get content chunks for a specific entity."""
         raise NotImplementedError
+    
+    def iter_contents(self, entity_ids: Iterable[str], max_workers: int = 16) -> Iterator[List[Chunk]]:
+        """Get content chunks for many entities, fetching them concurrently.
+        
+        Yields the chunks of each entity in the order of entity_ids. At most
+        2 * max_workers entities are in flight at once, so a lazy entity_ids
+        is only read ahead that far and finished entities are not buffered.
+        """
+        fetch = lambda entity_id: list(self.iter_content(entity_id))
+        entity_ids = iter(entity_ids)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque(executor.submit(fetch, entity_id)
+                            for entity_id in islice(entity_ids, 2 * max_workers))
+            while pending:
+                chunks = pending.popleft().result()
+                for entity_id in islice(entity_ids, 1):
+                    pending.append(executor.submit(fetch, entity_id))
+                yield chunks
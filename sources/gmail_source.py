@@ -1,9 +1,25 @@
-import base64
-from typing import Dict, Iterator, List
+import binascii
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List
+import httplib2
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from .base_source import BaseSource, Chunk
 
+# Gmail rejects batch requests with more than 100 calls
+MAX_BATCH_SIZE = 100
+
+# Partial response covering only what _message_chunks reads
+MESSAGE_FIELDS = 'id,snippet,payload(mimeType,filename,headers(name,value),body(data,attachmentId),parts)'
+
+# Maps URL-safe base64 to the standard alphabet binascii expects
+_URLSAFE_TRANS = str.maketrans('-_', '+/')
+
+def _b64decode(data: str) -> bytes:
+    """Decode Gmail's URL-safe base64 straight through binascii."""
+    return binascii.a2b_base64(data.translate(_URLSAFE_TRANS))
+
 class GmailSource(BaseSource):
     """Gmail connector for Airweave."""
     
@@ -16,17 +32,36 @@ class GmailSource(BaseSource):
             client_secret=config['credentials_json']['client_secret'],
             token_uri='https://oauth2.googleapis.com/token'
         )
-        self.service = build('gmail', 'v1', credentials=self.credentials)
+        # One authorized HTTP session for all API calls. Responses hold full
+        # message bodies, so they are only cached on disk when a cache
+        # directory is configured explicitly
+        self._http = AuthorizedHttp(
+            self.credentials,
+            http=httplib2.Http(cache=config.get('http_cache_dir'))
+        )
+        self.service = build('gmail', 'v1', http=self._http, cache_discovery=False)
+    
+    def close(self):
+        """Close the underlying HTTP session."""
+        self.service.close()
     
     def list_entities(self) -> Iterator[str]:
-        """List all message IDs."""
+        """List all message IDs, fetching one page at a time."""
         print("Listing Gmail messages...")
         try:
-            results = self.service.users().messages().list(userId='me').execute()
-            messages = results.get('messages', [])
-            print(f"Found {len(messages)} messages")
-            for message in messages:
-                yield message['id']
+            page_token = None
+            while True:
+                results = self.service.users().messages().list(
+                    userId='me',
+                    pageToken=page_token,
+                    maxResults=500
+                ).execute()
+                for message in results.get('messages', []):
+                    yield message['id']
+                
+                page_token = results.get('nextPageToken')
+                if not page_token:
+                    break
         except Exception as e:
             print(f"Error listing messages: {str(e)}")
             raise
@@ -46,14 +81,53 @@ class GmailSource(BaseSource):
 
     def iter_content(self, message_id: str) -> Iterator[Chunk]:
         """Get content of a specific message including attachments."""
-        message = self.service.users().messages().get(userId='me', id=message_id).execute()
+        message = self.service.users().messages().get(
+            userId='me',
+            id=message_id,
+            fields=MESSAGE_FIELDS
+        ).execute()
+        yield from self._message_chunks(message_id, message)
+    
+    def iter_contents(self, message_ids: Iterable[str], batch_size: int = 50) -> Iterator[List[Chunk]]:
+        """Get content of many messages using Gmail batch requests.
         
-        # Extract headers
-        headers = {}
-        for header in message['payload']['headers']:
-            name = header['name'].lower()
-            if name in ['from', 'to', 'subject', 'date']:
-                headers[name] = header['value']
+        Up to batch_size messages (capped at MAX_BATCH_SIZE) are fetched per
+        HTTP round trip. Messages whose call fails inside a batch, e.g. when
+        rate limited, are refetched individually. Yields the chunks of each
+        message, in order.
+        """
+        batch_size = min(batch_size, MAX_BATCH_SIZE)
+        ids = iter(message_ids)
+        while True:
+            batch_ids = list(islice(ids, batch_size))
+            if not batch_ids:
+                break
+            
+            messages = {}
+            
+            def store_message(request_id, response, exception):
+                if exception is None:
+                    messages[request_id] = response
+            
+            batch = self.service.new_batch_http_request(callback=store_message)
+            for idx, message_id in enumerate(batch_ids):
+                batch.add(
+                    self.service.users().messages().get(userId='me', id=message_id, fields=MESSAGE_FIELDS),
+                    request_id=str(idx)
+                )
+            batch.execute()
+            
+            for idx, message_id in enumerate(batch_ids):
+                message = messages.get(str(idx))
+                if message is None:
+                    yield list(self.iter_content(message_id))
+                else:
+                    yield list(self._message_chunks(message_id, message))
+    
+    def _message_chunks(self, message_id: str, message: Dict) -> Iterator[Chunk]:
+        """Build chunks for a fetched message, downloading attachments."""
+        # Extract headers, keyed case-insensitively
+        headers = {header['name'].lower(): header['value'] for header in message['payload']['headers']}
         
         # Get all message parts
         parts = self._get_parts(message['payload'])
@@ -63,9 +137,7 @@ class GmailSource(BaseSource):
         for part in parts:
             if part.get('mimeType', '').startswith('text/plain'):
                 if 'data' in part['body']:
-                    main_content = base64.urlsafe_b64decode(
-                        part['body']['data'].encode('ASCII')
-                    ).decode('utf-8')
+                    main_content = _b64decode(part['body']['data']).decode('utf-8')
                     break
         
         if not main_content:
@@ -103,7 +175,7 @@ Date: {headers.get('date', 'Unknown')}
                         id=part['body']['attachmentId']
                     ).execute()
                     
-                    file_data = base64.urlsafe_b64decode(attachment['data'].encode('ASCII'))
+                    file_data = _b64decode(attachment['data'])
                     
                     yield Chunk(
                         content=file_data,
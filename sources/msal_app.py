@@ -0,0 +1,15 @@
+from functools import lru_cache
+import msal
+
+@lru_cache(maxsize=32)
+def get_msal_app(client_id: str, client_secret: str, tenant_id: str) -> msal.ConfidentialClientApplication:
+    """Return a shared MSAL app for a Microsoft Graph tenant.
+    
+    Building the app runs authority discovery, so sources using the same
+    credentials share one instance along with its token cache.
+    """
+    return msal.ConfidentialClientApplication(
+        client_id,
+        authority=f'https://login.microsoftonline.com/{tenant_id}',
+        client_credential=client_secret
+    )
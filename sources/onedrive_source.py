@@ -1,7 +1,7 @@
 from typing import Dict, Iterator
-import msal
-import requests
-from .base_source import BaseSource, Chunk
+import orjson
+from .base_source import BaseSource, Chunk, _SHARED_SESSION
+from .msal_app import get_msal_app
 
 class OneDriveSource(BaseSource):
     """OneDrive connector for Airweave."""
@@ -14,12 +14,9 @@ class OneDriveSource(BaseSource):
         self.authority = f'https://login.microsoftonline.com/{self.tenant_id}'
         self.scopes = ['https://graph.microsoft.com/.default']
         
-        self.app = msal.ConfidentialClientApplication(
-            self.client_id,
-            authority=self.authority,
-            client_credential=self.client_secret
-        )
+        self.app = get_msal_app(self.client_id, self.client_secret, self.tenant_id)
         self._access_token = None
+        self._session = _SHARED_SESSION
     
     def _get_token(self) -> str:
         """Get Microsoft Graph access token."""
@@ -36,12 +33,12 @@ class OneDriveSource(BaseSource):
             'Authorization': f'Bearer {self._get_token()}',
             'Accept': 'application/json'
         }
-        response = requests.get(
+        response = self._session.get(
             'https://graph.microsoft.com/v1.0/me/drive/root/children',
             headers=headers
         )
         response.raise_for_status()
-        files = response.json().get('value', [])
+        files = orjson.loads(response.content).get('value', [])
         for file in files:
             yield file['id']
     
@@ -53,16 +50,16 @@ class OneDriveSource(BaseSource):
         }
         
         # Get file metadata
-        response = requests.get(
+        response = self._session.get(
             f'https://graph.microsoft.com/v1.0/me/drive/items/{file_id}',
             headers=headers
         )
         response.raise_for_status()
-        file = response.json()
+        file = orjson.loads(response.content)
         
         # For text files, get content
         if 'file' in file and file['file'].get('mimeType', '').startswith('text/'):
-            content_response = requests.get(
+            content_response = self._session.get(
                 f'https://graph.microsoft.com/v1.0/me/drive/items/{file_id}/content',
                 headers=headers
             )
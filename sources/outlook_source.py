@@ -1,7 +1,7 @@
 from typing import Dict, Iterator
-import msal
-import requests
-from .base_source import BaseSource, Chunk
+import orjson
+from .base_source import BaseSource, Chunk, _SHARED_SESSION
+from .msal_app import get_msal_app
 
 class OutlookSource(BaseSource):
     """Outlook/Microsoft Graph connector for Airweave."""
@@ -14,12 +14,9 @@ class OutlookSource(BaseSource):
         self.authority = f'https://login.microsoftonline.com/{self.tenant_id}'
         self.scopes = ['https://graph.microsoft.com/.default']
         
-        self.app = msal.ConfidentialClientApplication(
-            self.client_id,
-            authority=self.authority,
-            client_credential=self.client_secret
-        )
+        self.app = get_msal_app(self.client_id, self.client_secret, self.tenant_id)
         self._access_token = None
+        self._session = _SHARED_SESSION
     
     def _get_token(self) -> str:
         """Get Microsoft Graph access token."""
@@ -36,12 +33,12 @@ class OutlookSource(BaseSource):
             'Authorization': f'Bearer {self._get_token()}',
             'Accept': 'application/json'
         }
-        response = requests.get(
+        response = self._session.get(
             'https://graph.microsoft.com/v1.0/me/messages',
             headers=headers
         )
         response.raise_for_status()
-        messages = response.json().get('value', [])
+        messages = orjson.loads(response.content).get('value', [])
         for message in messages:
             yield message['id']
     
@@ -51,12 +48,12 @@ class OutlookSource(BaseSource):
             'Authorization': f'Bearer {self._get_token()}',
             'Accept': 'application/json'
         }
-        response = requests.get(
+        response = self._session.get(
             f'https://graph.microsoft.com/v1.0/me/messages/{message_id}',
             headers=headers
         )
         response.raise_for_status()
-        message = response.json()
+        message = orjson.loads(response.content)
         
         content = f"""
 From: {message.get('from', {}).get('emailAddress', {}).get('address', 'Unknown')}
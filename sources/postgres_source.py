@@ -1,6 +1,6 @@
-from typing import Dict, Iterator
+from typing import Dict, Iterable, Iterator, List
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2 import sql
 from .base_source import BaseSource, Chunk
 
 class PostgresSource(BaseSource):
@@ -37,40 +37,68 @@ class PostgresSource(BaseSource):
                     for (table_name,) in cur.fetchall():
                         yield table_name
     
+    def _aggregate_query(self, table_name: str) -> sql.Composable:
+        """Build the query aggregating a table's rows into (row_count, JSON array)."""
+        # Find table config if it exists
+        table_config = None
+        if self.tables:
+            for table in self.tables:
+                if isinstance(table, dict) and table['name'] == table_name:
+                    table_config = table
+                    break
+        
+        if table_config and 'query' in table_config:
+            rows_query = sql.SQL(table_config['query'].strip().rstrip(';'))
+        else:
+            rows_query = sql.SQL("SELECT * FROM {} LIMIT 1000").format(sql.Identifier(table_name))
+        return sql.SQL("SELECT count(*), jsonb_agg(t)::text FROM ({}) t").format(rows_query)
+    
+    def _table_chunks(self, table_name: str, row_count: int, content: str) -> Iterator[Chunk]:
+        """Build the chunk for an aggregated table, if it has rows."""
+        if not row_count:
+            return
+        
+        yield Chunk(
+            content=content,
+            metadata={
+                'source': 'postgres',
+                'table': table_name,
+                'row_count': row_count
+            }
+        )
+    
     def iter_content(self, table_name: str) -> Iterator[Chunk]:
-        """Get content of a specific table."""
+        """Get content of a specific table.
+        
+        Rows are aggregated into a single JSON array by Postgres, so the
+        table is shipped as one value instead of being formatted per row.
+        """
         with psycopg2.connect(**self.conn_params) as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                # Find table config if it exists
-                table_config = None
-                if self.tables:
-                    for table in self.tables:
-                        if isinstance(table, dict) and table['name'] == table_name:
-                            table_config = table
-                            break
-                
-                # Execute query
-                if table_config and 'query' in table_config:
-                    cur.execute(table_config['query'])
-                else:
-                    cur.execute(f"SELECT * FROM {table_name} LIMIT 1000")
-                
-                rows = cur.fetchall()
-                if not rows:
-                    return
-                
-                # Format as readable text
-                content = f"Table: {table_name}\n\n"
-                for row in rows:
-                    content += "---\n"
-                    for key, value in row.items():
-                        content += f"{key}: {value}\n"
-                
-                yield Chunk(
-                    content=content,
-                    metadata={
-                        'source': 'postgres',
-                        'table': table_name,
-                        'row_count': len(rows)
-                    }
-                )
+            with conn.cursor() as cur:
+                cur.execute(self._aggregate_query(table_name))
+                row_count, content = cur.fetchone()
+        
+        yield from self._table_chunks(table_name, row_count, content)
+    
+    def iter_contents(self, table_names: Iterable[str]) -> Iterator[List[Chunk]]:
+        """Get content of many tables in a single round trip.
+        
+        The per-table aggregates are combined with UNION ALL and sent as
+        one statement over one connection. Yields the chunks of each table
+        in the order of table_names.
+        """
+        table_names = list(table_names)
+        if not table_names:
+            return
+        
+        query = sql.SQL(" UNION ALL ").join(
+            sql.SQL("SELECT {}, * FROM ({}) agg").format(sql.Literal(idx), self._aggregate_query(table_name))
+            for idx, table_name in enumerate(table_names)
+        )
+        with psycopg2.connect(**self.conn_params) as conn:
+            with conn.cursor() as cur:
+                cur.execute(query)
+                results = {idx: (row_count, content) for idx, row_count, content in cur.fetchall()}
+        
+        for idx, table_name in enumerate(table_names):
+            yield list(self._table_chunks(table_name, *results[idx]))
@@ -1,9 +1,35 @@
-from typing import Iterator, Dict, Any, Optional
+from functools import lru_cache
+from typing import Iterator, Dict, Any, Optional, Tuple
 import os
 import json
-from datetime import datetime, timedelta
-import requests
-from .base_source import BaseSource, Chunk
+import time
+import orjson
+import requests_cache
+from .base_source import BaseSource, Chunk, _SHARED_SESSION
+
+# Refresh tokens this many seconds before SAP expires them
+TOKEN_EXPIRY_MARGIN = 30
+
+# Process-wide OAuth tokens keyed by (base_url, client_id) -> (token, expiry)
+_TOKEN_CACHE: Dict[Tuple[str, str], Tuple[str, float]] = {}
+
+@lru_cache(maxsize=None)
+def _get_session(cache_path: str) -> requests_cache.CachedSession:
+    """Create the cached HTTP session for one cache file, once per process.
+    
+    OData GETs are cached on disk and revalidated with ETag/If-Modified-Since,
+    so unchanged purchase orders come back as 304s; the connection pool is
+    shared with the other HTTP sources. SAP errors are raised rather than
+    answered with a cached copy that may be out of date.
+    """
+    session = requests_cache.CachedSession(
+        cache_path,
+        backend='sqlite',
+        cache_control=True,
+        expire_after=requests_cache.EXPIRE_IMMEDIATELY
+    )
+    session.mount('https://', _SHARED_SESSION.get_adapter('https://'))
+    return session
 
 class SAPSource(BaseSource):
     """Custom source for SAP S/4HANA OData service.
@@ -18,12 +44,19 @@ class SAPSource(BaseSource):
         self.client_id = config.get('client_id', 'demo')
         self.client_secret = config.get('client_secret', 'demo')
         self.service_path = config.get('service_path', '/sap/opu/odata/sap/ZKB_PO_SRV')
-        self._access_token = None
-        self._token_expires_at = None
+        self.cache_path = config.get('cache_path') or os.getenv('SAP_CACHE_PATH', '.sap_cache')
+        self._session = None
         
         # For development/testing
         self.use_mock = os.getenv('SAP_MOCK', 'true').lower() == 'true'
 
+    @property
+    def session(self) -> requests_cache.CachedSession:
+        """HTTP session for this source's cache file, created on first use."""
+        if self._session is None:
+            self._session = _get_session(self.cache_path)
+        return self._session
+
     def _get_mock_data(self, path: str) -> Dict[str, Any]:
         """Return mock data for development/testing."""
         if path == '/PurchaseOrders':
@@ -67,12 +100,21 @@ class SAPSource(BaseSource):
         return {'d': {'results': []}}
 
     def _get_auth_token(self) -> str:
-        """Get OAuth2 access token for SAP API."""
+        """Get OAuth2 access token for SAP API.
+        
+        Tokens are shared by all sources talking to the same SAP tenant and
+        reused until shortly before they expire.
+        """
         if self.use_mock:
             return 'mock-token'
+        
+        key = (self.base_url, self.client_id)
+        cached = _TOKEN_CACHE.get(key)
+        if cached and time.monotonic() < cached[1] - TOKEN_EXPIRY_MARGIN:
+            return cached[0]
             
         token_url = f"{self.base_url}/oauth/token"
-        response = requests.post(
+        response = self.session.post(
             token_url,
             data={
                 'grant_type': 'client_credentials',
@@ -83,8 +125,8 @@ class SAPSource(BaseSource):
         )
         response.raise_for_status()
         
-        token_data = response.json()
-        self._token_expires_at = datetime.now() + timedelta(seconds=token_data['expires_in'])
+        token_data = orjson.loads(response.content)
+        _TOKEN_CACHE[key] = (token_data['access_token'], time.monotonic() + token_data['expires_in'])
         return token_data['access_token']
 
     def _make_request(self, path: str) -> Dict[str, Any]:
@@ -92,20 +134,18 @@ class SAPSource(BaseSource):
         if self.use_mock:
             return self._get_mock_data(path)
             
-        if not self._access_token or datetime.now() >= self._token_expires_at:
-            self._access_token = self._get_auth_token()
-            
         headers = {
-            'Authorization': f'Bearer {self._access_token}',
+            'Authorization': f'Bearer {self._get_auth_token()}',
             'Accept': 'application/json'
         }
         
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}{self.service_path}{path}",
             headers=headers
         )
         response.raise_for_status()
-        return response.json()
+        # Parse the raw body with orjson; large $expand payloads dominate CPU
+        return orjson.loads(response.content)
 
     def _format_po_as_text(self, po_data: Dict[str, Any]) -> str:
         """Format PO data as searchable text."""
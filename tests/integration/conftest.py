@@ -1,10 +1,15 @@
 """Integration test configuration and fixtures."""
+import functools
 import os
 import pytest
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict
 
-def load_credentials(service: str) -> Optional[Dict]:
+# Returned by load_credentials when required variables are not set
+_MISSING = object()
+
+@functools.lru_cache(maxsize=4)
+def load_credentials(service: str):
     """
     Safely load credentials for a service from environment variables.
     Never logs or prints credential values.
@@ -13,7 +18,8 @@ def load_credentials(service: str) -> Optional[Dict]:
         service: Service name (gmail, gdrive)
         
     Returns:
-        Dict of credentials if available, None if missing required credentials
+        Dict of credentials if available, _MISSING if required credentials
+        are not set
     """
     if service == 'gmail':
         required_vars = [
@@ -32,32 +38,68 @@ def load_credentials(service: str) -> Optional[Dict]:
     else:
         raise ValueError(f"Unknown service: {service}")
     
-    # Check all required variables exist
-    missing = [var for var in required_vars if not os.getenv(var)]
+    # Read every variable once and check all required ones exist
+    env = {var: os.getenv(var) for var in required_vars}
+    missing = [var for var, value in env.items() if not value]
     if missing:
-        pytest.skip(f"Missing required environment variables for {service}: {', '.join(missing)}")
-        return None
+        return _MISSING
         
-    if service in ['gmail', 'gdrive']:
-        return {
-            'credentials_json': {
-                'client_id': os.getenv('GOOGLE_CLIENT_ID'),
-                'client_secret': os.getenv('GOOGLE_CLIENT_SECRET'),
-                'refresh_token': os.getenv('GOOGLE_REFRESH_TOKEN')
-            }
+    return {
+        'credentials_json': {
+            'client_id': env['GOOGLE_CLIENT_ID'],
+            'client_secret': env['GOOGLE_CLIENT_SECRET'],
+            'refresh_token': env['GOOGLE_REFRESH_TOKEN']
         }
-    
-    return None
+    }
 
-@pytest.fixture
+def _require_credentials(service: str) -> Dict:
+    """Load credentials for a service, skipping the test if any are missing."""
+    credentials = load_credentials(service)
+    if credentials is _MISSING:
+        pytest.skip(f"Missing required environment variables for {service}")
+    return credentials
+
+@pytest.fixture(scope="session")
 def gmail_credentials():
     """Gmail credentials fixture. Skips test if credentials not available."""
-    return load_credentials('gmail')
+    return _require_credentials('gmail')
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gdrive_credentials():
     """GDrive credentials fixture. Skips test if credentials not available."""
-    return load_credentials('gdrive')
+    return _require_credentials('gdrive')
+
+@pytest.fixture(scope="session")
+def gmail_source(gmail_credentials):
+    """Gmail source shared across tests so the HTTP session is reused."""
+    from sources.gmail_source import GmailSource
+    
+    source = GmailSource(gmail_credentials)
+    yield source
+    source.close()
+
+@pytest.fixture(scope="session")
+def qdrant_client():
+    """Qdrant client shared by tests that seed the vector store."""
+    from vectorstore.qdrant import get_qdrant_client
+    
+    return get_qdrant_client()
+
+@pytest.fixture(scope="session")
+def airweave_client():
+    """Airweave SDK client shared across tests."""
+    from tools.airweave.sdk import AirweaveClient
+    
+    return AirweaveClient()
+
+@pytest.fixture(scope="session")
+def alias_map():
+    """Alias map populated with the test suppliers."""
+    from tools.alias_map import AliasMap
+    
+    alias_map = AliasMap()
+    alias_map.add_supplier('SUP-000045', 'TechCorp', {'Tech Corporation', 'TechCorp Inc'})
+    return alias_map
 
 @pytest.fixture
 def test_email():
@@ -1,10 +1,62 @@
 """Integration tests for supplier context provider."""
 import pytest
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import json
+from types import SimpleNamespace
 
 from services.context_provider import ContextProvider
 
+@dataclass(slots=True)
+class MockHit:
+    """Qdrant search hit carrying only a payload."""
+    payload: dict
+
+@dataclass(slots=True)
+class MockResult:
+    """SQLAlchemy result returning a single prebuilt row."""
+    row: object
+    
+    def first(self):
+        return self.row
+
+class MockPipeline:
+    """Buffers commands like a Redis pipeline and runs them on execute()."""
+    
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+        
+    async def __aenter__(self):
+        return self
+        
+    async def __aexit__(self, *exc_info):
+        self.commands = []
+        
+    def get(self, key):
+        self.commands.append(key)
+        return self
+        
+    async def execute(self):
+        results = [self.redis.store.get(key) for key in self.commands]
+        self.commands = []
+        return results
+
+class MockRedis:
+    """In-memory stand-in for the async Redis client."""
+    
+    def __init__(self):
+        self.store = {}
+        
+    async def get(self, key):
+        return self.store.get(key)
+        
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+        
+    def pipeline(self, transaction=True):
+        return MockPipeline(self)
+
 @pytest.fixture
 def mock_supplier():
     """Mock supplier data."""
@@ -88,16 +140,12 @@ def context_provider(
         redis_url="redis://localhost:6379"
     )
     
-    # Mock database query
-    def mock_get_supplier(*args, **kwargs):
-        class MockResult:
-            def first(self):
-                return type('Row', (), mock_supplier)
-        return MockResult()
+    # Mock database query with a row built once per fixture
+    supplier_result = MockResult(SimpleNamespace(**mock_supplier))
     
     # Mock async execute to return a coroutine
     async def mock_execute(*args, **kwargs):
-        return mock_get_supplier()
+        return supplier_result
     
     monkeypatch.setattr(
         "sqlalchemy.ext.asyncio.AsyncSession.execute",
@@ -122,27 +170,15 @@ def context_provider(
             docs = mock_internal_docs
             
         # Convert to Qdrant response format
-        class MockHit:
-            def __init__(self, doc):
-                self.payload = {
-                    "title": doc.get("title", ""),
-                    "content": doc["content"],
-                    "metadata": doc["metadata"]
-                }
-                
-        return [MockHit(doc) for doc in docs]
-    
-    # Mock Redis with in-memory storage
-    class MockRedis:
-        def __init__(self):
-            self.store = {}
-            
-        def get(self, key):
-            return self.store.get(key)
-            
-        def setex(self, key, ttl, value):
-            self.store[key] = value
-            
+        return [
+            MockHit({
+                "title": doc.get("title", ""),
+                "content": doc["content"],
+                "metadata": doc["metadata"]
+            })
+            for doc in docs
+        ]
+    
     mock_redis = MockRedis()
         
     # Replace Redis instance with our mock
@@ -227,3 +263,15 @@ async def test_caching(context_provider):
         "nonexistent_hash"
     )
     assert missing is None
+
+@pytest.mark.asyncio
+async def test_bulk_cached_reviews(context_provider):
+    """Test pipelined lookup of several cached reviews."""
+    await context_provider.cache_review("SUP-000045", "hash-a", {"score": 0.5})
+    await context_provider.cache_review("SUP-000046", "hash-b", {"score": 0.7})
+    
+    cached = await context_provider.get_cached_reviews(
+        ["SUP-000045", "SUP-000046", "SUP-000047"],
+        ["hash-a", "hash-b", "hash-c"]
+    )
+    assert cached == [{"score": 0.5}, {"score": 0.7}, None]
@@ -1,6 +1,7 @@
 import os
 import pytest
 from datetime import datetime
+from itertools import islice
 
 @pytest.mark.integration
 @pytest.mark.skipif(not os.getenv('GMAIL_TEST'), reason='GMAIL_TEST not set')
@@ -18,8 +19,8 @@ def test_gmail_integration():
     
     source = GmailSource(config)
     
-    # Should list messages
-    messages = list(source.list_entities())
+    # Should list messages without paging through the whole mailbox
+    messages = list(islice(source.list_entities(), 5))
     assert len(messages) > 0
     
     # Should get message content
@@ -13,33 +13,33 @@ Required environment variables:
 import os
 import pytest
 from dotenv import load_dotenv
+from itertools import islice
 
 # Load environment variables from .env file
 load_dotenv()
 from datetime import datetime, timedelta
-from sources.gmail_source import GmailSource
 
 pytestmark = pytest.mark.skipif(
     not os.getenv('GMAIL_TEST'), 
     reason='Gmail integration tests require GMAIL_TEST=1'
 )
 
-def test_gmail_list_messages(gmail_credentials, test_email):
+def test_gmail_list_messages(gmail_source, test_email):
     """Test listing messages from real Gmail account."""
-    source = GmailSource(gmail_credentials)
+    source = gmail_source
     
-    # Get message IDs
-    message_ids = list(source.list_entities())
+    # Stream message IDs and only pull the first few
+    preview = list(islice(source.list_entities(), 5))
     
     # Basic validation
-    assert len(message_ids) > 0, "No messages found in Gmail account"
-    assert all(isinstance(id, str) for id in message_ids), "Invalid message ID format"
+    assert len(preview) > 0, "No messages found in Gmail account"
+    assert all(isinstance(id, str) for id in preview), "Invalid message ID format"
     
     print("\n=== Gmail Messages ===")
-    print(f"Total messages found: {len(message_ids)}")
+    print(f"Previewing {len(preview)} messages")
     
     # Get content for first few messages to show subjects
-    for message_id in message_ids[:5]:  # Show up to 5 messages
+    for message_id in preview:
         chunks = list(source.iter_content(message_id))
         if chunks:
             chunk = chunks[0]
@@ -47,17 +47,16 @@ def test_gmail_list_messages(gmail_credentials, test_email):
             print(f"Date: {chunk.metadata.get('date')}")
             print(f"From: {chunk.metadata.get('from', '[Unknown]')}")
 
-def test_gmail_read_message(gmail_credentials, test_email):
+def test_gmail_read_message(gmail_source, test_email):
     """Test reading message content from real Gmail account."""
-    source = GmailSource(gmail_credentials)
+    source = gmail_source
     
     # Get message IDs
-    message_ids = list(source.list_entities())
+    message_ids = list(islice(source.list_entities(), 50))
     assert len(message_ids) > 0, "No messages found in Gmail account"
     
-    # Check each message for attachments
-    for message_id in message_ids:
-        chunks = list(source.iter_content(message_id))
+    # Fetch messages in batches and check each one for attachments
+    for chunks in source.iter_contents(message_ids):
         assert len(chunks) > 0, "No content returned for message"
         
         print(f"\n{'='*20} Message {'='*20}")
@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+import uuid
 import pytest
 from unittest.mock import patch
 
@@ -13,16 +14,17 @@ from dagster_jobs.ops.supplier_risk import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def seed_supplier_docs(qdrant_client: QdrantClient):
     """Seed test documents for SUP-DEMO supplier."""
+    timestamp = datetime.now(timezone.utc).isoformat()
     docs = [
         {
             "content": "Email: Supplier SUP-DEMO has missed payment deadline for Q2",
             "metadata": {
                 "supplier_id": "SUP-DEMO",
                 "collection": "emails",
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": timestamp
             }
         },
         {
@@ -30,7 +32,7 @@ def seed_supplier_docs(qdrant_client: QdrantClient):
             "metadata": {
                 "supplier_id": "SUP-DEMO",
                 "collection": "emails",
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": timestamp
             }
         },
         {
@@ -38,24 +40,28 @@ def seed_supplier_docs(qdrant_client: QdrantClient):
             "metadata": {
                 "supplier_id": "SUP-DEMO",
                 "collection": "news",
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": timestamp
             }
         }
     ]
     
-    # Insert documents into Qdrant
-    for doc in docs:
-        qdrant_client.upsert(
-            collection_name="supplier_docs",
-            points=[{
-                "id": f"test-{doc['metadata']['collection']}-{doc['metadata']['timestamp']}",
+    # Insert all documents into Qdrant in one request
+    qdrant_client.upsert(
+        collection_name="supplier_docs",
+        points=[
+            {
+                # Qdrant point IDs must be integers or UUIDs
+                "id": str(uuid.uuid5(uuid.NAMESPACE_OID, f"test-{doc['metadata']['collection']}-{i}")),
                 "payload": {
                     "content": doc["content"],
                     "metadata": doc["metadata"]
                 },
                 "vector": [0.1] * 384  # Dummy vector
-            }]
-        )
+            }
+            for i, doc in enumerate(docs)
+        ],
+        wait=True
+    )
     
     yield docs
     
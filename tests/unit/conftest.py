@@ -0,0 +1,64 @@
+"""Unit test fixtures shared across loader and source tests."""
+import pytest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from sources.msal_app import get_msal_app
+from tools.airweave_loader import load_csv, load_mbox
+
+@pytest.fixture(scope="session")
+def csv_records():
+    """Purchase order records parsed once from fixtures/po.csv."""
+    return list(load_csv(Path('fixtures/po.csv')))
+
+@pytest.fixture(scope="session")
+def mbox_records():
+    """Email records parsed once from fixtures/gmail_5msgs.mbox."""
+    return list(load_mbox(Path('fixtures/gmail_5msgs.mbox')))
+
+@pytest.fixture(autouse=True)
+def clear_msal_apps():
+    """Drop cached MSAL apps so each test sees its own patched client."""
+    get_msal_app.cache_clear()
+    yield
+    get_msal_app.cache_clear()
+
+@pytest.fixture(scope="session", autouse=True)
+def google_build():
+    """Patch Google API discovery and credentials once per session.
+    
+    Yields the Gmail and Drive build() mocks; tests get a fresh service
+    through the gmail_service and drive_service fixtures.
+    """
+    with patch('sources.gmail_source.build') as gmail_build, \
+         patch('sources.gmail_source.Credentials'), \
+         patch('sources.gdrive_source.build') as drive_build, \
+         patch('sources.gdrive_source.Credentials'):
+        yield gmail_build, drive_build
+
+@pytest.fixture
+def gmail_service(google_build):
+    """Mocked Gmail service returned by build() for this test."""
+    gmail_build, _ = google_build
+    gmail_build.return_value = Mock()
+    return gmail_build.return_value
+
+@pytest.fixture
+def drive_service(google_build):
+    """Mocked Drive service returned by build() for this test."""
+    _, drive_build = google_build
+    drive_build.return_value = Mock()
+    return drive_build.return_value
+
+@pytest.fixture(scope="session", autouse=True)
+def msal_app_class():
+    """Patch MSAL's ConfidentialClientApplication once per session."""
+    with patch('msal.ConfidentialClientApplication') as mock_msal:
+        yield mock_msal
+
+@pytest.fixture
+def mock_msal(msal_app_class):
+    """Reset MSAL mock for this test, granting a test token by default."""
+    msal_app_class.reset_mock(return_value=True)
+    msal_app_class.return_value.acquire_token_silent.return_value = {'access_token': 'test-token'}
+    return msal_app_class
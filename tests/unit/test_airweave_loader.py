@@ -1,8 +1,10 @@
 """Unit tests for airweave_loader.py"""
+import csv
+import threading
 import pytest
-from pathlib import Path
 from unittest.mock import Mock, patch
-from tools.airweave_loader import main, load_csv, load_mbox, load_parquet
+from pathlib import Path
+from tools.airweave_loader import ingest_records, load_csv, load_jsonl, load_mbox
 
 @pytest.fixture
 def mock_airweave_client():
@@ -11,44 +13,145 @@ def mock_airweave_client():
         mock.return_value = client_instance
         yield client_instance
 
-@pytest.fixture
-def sample_csv_path():
-    return Path('fixtures/po.csv')
-
-def test_load_csv(sample_csv_path):
+def test_load_csv(csv_records):
     """Test CSV loading functionality"""
-    records = load_csv(sample_csv_path)
-    assert len(records) == 5
-    assert records[0]['po_number'] == 'PO12345'
-    assert records[0]['supplier_name'] == 'Acme Corporation'
+    assert len(csv_records) == 5
+    assert csv_records[0]['po_number'] == 'PO12345'
+    assert csv_records[0]['supplier_name'] == 'Acme Corporation'
+
+def test_load_csv_parses_like_dictreader(tmp_path):
+    """Rows should come back as strings, exactly as csv.DictReader reads them."""
+    path = tmp_path / "po.csv"
+    path.write_text(
+        'po_number,supplier_name,amount,notes\n'
+        'PO1,Acme,10000.00,"multi\nline"\n'
+        '00042,"Globex, Inc",,\n'
+    )
+    
+    with patch('tools.airweave_loader.SchemaValidator.validate_batch', side_effect=lambda records, _: records), \
+         patch('tools.airweave_loader.QualityChecker.check_batch_quality', return_value={}):
+        records = list(load_csv(path))
+    
+    with open(path, newline='') as f:
+        assert records == list(csv.DictReader(f))
+
+def test_load_csv_ragged_rows(tmp_path):
+    """Rows with missing or extra fields should reach validation like DictReader reads them."""
+    path = tmp_path / "po.csv"
+    path.write_text(
+        'po_number,vendor,amount\n'
+        'PO-1,Acme\n'
+        'PO-2,Globex,20.00\n'
+        'PO-3,Initech,30.00,extra\n'
+    )
+    
+    with patch('tools.airweave_loader.SchemaValidator.validate_batch', side_effect=lambda records, _: records), \
+         patch('tools.airweave_loader.QualityChecker.check_batch_quality', return_value={}):
+        records = list(load_csv(path))
+    
+    with open(path, newline='') as f:
+        expected = list(csv.DictReader(f))
+    assert sorted(records, key=lambda r: r['po_number']) == expected
+    assert {'po_number': 'PO-1', 'vendor': 'Acme', 'amount': None} in records
 
-def test_load_mbox():
+def test_load_mbox(mbox_records):
     """Test mbox loading functionality"""
-    records = load_mbox(Path('fixtures/gmail_5msgs.mbox'))
-    assert len(records) == 5
-    assert records[0]['subject'] == 'RE: PO #12345 Confirmation'
-    assert records[0]['from'] == 'Test Supplier <test.supplier@acme.com>'
+    assert len(mbox_records) == 5
+    assert mbox_records[0]['subject'] == 'RE: PO #12345 Confirmation'
+    assert mbox_records[0]['from'] == 'Test Supplier <test.supplier@acme.com>'
 
-def test_bulk_ingest_with_metrics(mock_airweave_client, sample_csv_path):
+def test_load_mbox_parallel_shards(mbox_records):
+    """Parsing shards in worker processes should keep the records and their order."""
+    with patch('tools.airweave_loader.MBOX_SHARD_SIZE', 2):
+        records = list(load_mbox(Path('fixtures/gmail_5msgs.mbox'), workers=2))
+    
+    assert records == mbox_records
+
+def test_load_jsonl(tmp_path):
+    """JSONL records should stream one per line, skipping blank lines."""
+    path = tmp_path / "gdelt.jsonl"
+    path.write_text('{"title": "Müller recall", "tone": -2.5}\n\n{"title": "Acme"}\n', encoding='utf-8')
+    
+    records = load_jsonl(path)
+    assert next(records) == {'title': 'Müller recall', 'tone': -2.5}
+    assert list(records) == [{'title': 'Acme'}]
+
+def test_bulk_ingest_with_metrics(mock_airweave_client, csv_records):
     """Test bulk ingestion with Prometheus metrics"""
     with patch('tools.airweave_loader.DOCS_INGESTED.inc') as mock_counter, \
-         patch('tools.airweave_loader.INGEST_LATENCY.observe') as mock_latency, \
-         patch('tools.airweave_loader.start_http_server'):
+         patch('tools.airweave_loader.INGEST_LATENCY.observe') as mock_latency:
         
-        # Run loader
-        main(['--source', 'csv', '--collection', 'test_collection', str(sample_csv_path)])
+        # Ingest the already parsed records
+        ingest_records(mock_airweave_client, csv_records, 'csv', 'test_collection')
         
-        # Check if documents were ingested
-        assert mock_airweave_client.bulk_ingest.call_count == 5
+        # All documents fit in one batch
+        assert mock_airweave_client.bulk_ingest_batch.call_count == 1
+        docs = mock_airweave_client.bulk_ingest_batch.call_args[0][1]
+        assert len(docs) == 5
         
-        # Verify metrics were updated
-        assert mock_counter.call_count == 5
-        assert mock_latency.call_count == 5
+        # Verify metrics were updated once per batch
+        mock_counter.assert_called_once_with(5)
+        assert mock_latency.call_count == 1
         
         # Check document format
-        first_doc = mock_airweave_client.bulk_ingest.call_args_list[0][0][1]
-        assert 'content' in first_doc
+        first_doc = docs[0]
+        assert 'po_number: PO12345' in first_doc['content'].split('\n')
         assert 'metadata' in first_doc
         assert first_doc['metadata']['source'] == 'csv'
         assert first_doc['metadata']['collection'] == 'test_collection'
         assert first_doc['metadata']['po_number'] == 'PO12345'
+
+def test_ingest_records_batches_by_size(mock_airweave_client, mbox_records):
+    """Batches should honour batch_size and the byte budget."""
+    with patch('tools.airweave_loader.DOCS_INGESTED.inc') as mock_counter:
+        ingest_records(mock_airweave_client, mbox_records, 'mbox', 'test_collection', batch_size=2)
+    
+    batch_sizes = sorted(len(call[0][1]) for call in mock_airweave_client.bulk_ingest_batch.call_args_list)
+    assert batch_sizes == [1, 2, 2]
+    assert sum(call[0][0] for call in mock_counter.call_args_list) == 5
+    
+    # A byte budget smaller than one document falls back to single-document batches
+    mock_airweave_client.bulk_ingest_batch.reset_mock()
+    ingest_records(mock_airweave_client, mbox_records, 'mbox', 'test_collection', max_chunk_bytes=1)
+    assert mock_airweave_client.bulk_ingest_batch.call_count == 5
+
+def test_ingest_records_concurrently(mock_airweave_client, mbox_records):
+    """Ingest calls should overlap, and failed ones should be skipped."""
+    records = mbox_records[:4]
+    
+    # Only passes if three calls are in flight at the same time
+    barrier = threading.Barrier(3, timeout=5)
+    
+    def bulk_ingest_batch(collection, docs):
+        if docs[0]['metadata']['subject'] == records[3]['subject']:
+            raise RuntimeError('ingest failed')
+        barrier.wait()
+    
+    mock_airweave_client.bulk_ingest_batch.side_effect = bulk_ingest_batch
+    
+    with patch('tools.airweave_loader.DOCS_INGESTED.inc') as mock_counter, \
+         patch('tools.airweave_loader.INGEST_LATENCY.observe') as mock_latency:
+        ingest_records(mock_airweave_client, records, 'mbox', 'test_collection', concurrency=4, batch_size=1)
+    
+    assert mock_airweave_client.bulk_ingest_batch.call_count == 4
+    assert mock_counter.call_count == 3
+    assert mock_latency.call_count == 3
+
+def test_ingest_records_streams_from_loader(mock_airweave_client, mbox_records):
+    """Batches are ingested while the loader runs, and its errors surface."""
+    ingested = threading.Event()
+    mock_airweave_client.bulk_ingest_batch.side_effect = lambda collection, docs: ingested.set()
+    
+    def loader():
+        yield mbox_records[0]
+        # The first record reaches Airweave before the loader finishes
+        assert ingested.wait(timeout=5)
+        yield mbox_records[1]
+        raise OSError('truncated file')
+    
+    with patch('tools.airweave_loader.BATCH_SIZE_SAMPLE', 1), \
+         pytest.raises(OSError, match='truncated file'):
+        ingest_records(mock_airweave_client, loader(), 'mbox', 'test_collection',
+                       concurrency=2, batch_size=1, queue_size=1)
+    
+    assert mock_airweave_client.bulk_ingest_batch.call_count == 2
@@ -0,0 +1,52 @@
+"""Unit tests for the mock Airweave SDK."""
+import pytest
+from unittest.mock import patch
+
+from tools.airweave.sdk import AirweaveClient
+
+@pytest.fixture
+def client():
+    """Client backed by an empty document store."""
+    with patch.object(AirweaveClient, '_documents', {}), \
+         patch.object(AirweaveClient, '_by_collection', {}), \
+         patch.object(AirweaveClient, '_index', {}):
+        yield AirweaveClient()
+
+def _doc(supplier_id, **metadata):
+    return {'content': f'news about {supplier_id}', 'metadata': {'supplier_id': supplier_id, **metadata}}
+
+def test_query_filters_by_metadata(client):
+    """Filters should intersect and keep ingestion order."""
+    client.bulk_ingest_batch('news', [
+        _doc('SUP-1', source='gdelt'),
+        _doc('SUP-2', source='gdelt'),
+        _doc('SUP-1', source='rss'),
+        _doc('SUP-1', source='gdelt')
+    ])
+    client.bulk_ingest('emails', _doc('SUP-1', source='gdelt'))
+    
+    results = client.query('news', filters={'supplier_id': 'SUP-1', 'source': 'gdelt'})
+    assert [doc['content'] for doc in results] == ['news about SUP-1'] * 2
+    assert all(doc['collection'] == 'news' for doc in results)
+    
+    assert len(client.query('news')) == 4
+    assert client.query('news', filters={'supplier_id': 'SUP-3'}) == []
+    assert client.query('missing', filters={'supplier_id': 'SUP-1'}) == []
+
+def test_query_unhashable_metadata(client):
+    """Unhashable metadata values should still be matched."""
+    client.bulk_ingest('news', _doc('SUP-1', tags=['risk']))
+    client.bulk_ingest('news', _doc('SUP-2', tags=['ok']))
+    
+    results = client.query('news', filters={'tags': ['risk']})
+    assert [doc['metadata']['supplier_id'] for doc in results] == ['SUP-1']
+
+def test_delete_collection_clears_index(client):
+    """Deleted documents should no longer be returned."""
+    client.bulk_ingest('news', _doc('SUP-1'))
+    client.bulk_ingest('emails', _doc('SUP-1'))
+    
+    client.delete_collection('news')
+    
+    assert client.query('news', filters={'supplier_id': 'SUP-1'}) == []
+    assert len(client.query('emails', filters={'supplier_id': 'SUP-1'})) == 1
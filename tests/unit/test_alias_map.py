@@ -0,0 +1,44 @@
+"""Unit tests for supplier alias matching."""
+import pytest
+from tools.alias_map import AliasMap
+
+@pytest.fixture
+def alias_map():
+    alias_map = AliasMap()
+    alias_map.add_supplier('SUP-1', 'TechCorp Industries', {'TechCorp', 'TCI'})
+    alias_map.add_supplier('SUP-2', 'Acme Corporation', {'Acme'})
+    alias_map.add_supplier('SUP-3', 'Acme Logistics')
+    return alias_map
+
+def test_find_matches(alias_map):
+    """Aliases should match case- and punctuation-insensitively."""
+    assert alias_map.find_matches('TECHCORP, announced a recall') == {'SUP-1'}
+    assert alias_map.find_matches('Shares of ACME-Logistics fell') == {'SUP-2', 'SUP-3'}
+    assert alias_map.find_matches('No suppliers mentioned here') == set()
+
+def test_find_matches_normalized(alias_map):
+    """The fast path should match pre-normalized text like find_matches."""
+    text = 'Shares of ACME-Logistics fell'
+    assert alias_map.find_matches_normalized(AliasMap._normalize(text)) == alias_map.find_matches(text)
+    assert AliasMap().find_matches_normalized('acme') == set()
+
+def test_find_matches_after_update(alias_map):
+    """Replacing a supplier's aliases should take effect on the next match."""
+    assert alias_map.find_matches('TCI delays shipments') == {'SUP-1'}
+    
+    alias_map.add_supplier('SUP-1', 'TechCorp Industries')
+    assert alias_map.find_matches('TCI delays shipments') == set()
+    assert alias_map.find_matches('TechCorp Industries delays shipments') == {'SUP-1'}
+
+def test_find_matches_empty_map():
+    """An empty map should match nothing."""
+    assert AliasMap().find_matches('TechCorp') == set()
+
+@pytest.mark.parametrize("text,expected", [
+    ("Acme_Corp, Inc.\x00", "acme_corp inc"),
+    ("  TechCorp\t(Europe)  ", "techcorp europe"),
+    ("Müller-Bräu GmbH & Co.", "müller bräu gmbh co")
+], ids=["ascii", "whitespace", "unicode"])
+def test_normalize(text, expected):
+    """ASCII and non-ASCII text should normalize the same way."""
+    assert AliasMap._normalize(text) == expected
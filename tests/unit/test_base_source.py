@@ -0,0 +1,31 @@
+"""Unit tests for the shared source behaviour."""
+from sources.base_source import BaseSource, Chunk
+
+class CountingSource(BaseSource):
+    """Source returning one chunk per entity."""
+    
+    def iter_content(self, entity_id):
+        yield Chunk(content=entity_id, metadata={'id': entity_id})
+
+def test_iter_contents_keeps_order():
+    """iter_contents should yield each entity's chunks in input order."""
+    ids = [f'id{i}' for i in range(50)]
+    results = list(CountingSource({}).iter_contents(ids, max_workers=4))
+    assert [chunks[0].content for chunks in results] == ids
+
+def test_iter_contents_bounded_read_ahead():
+    """iter_contents should not read a lazy id stream past its window."""
+    consumed = []
+    
+    def entity_ids():
+        for i in range(1000):
+            consumed.append(i)
+            yield f'id{i}'
+    
+    results = CountingSource({}).iter_contents(entity_ids(), max_workers=4)
+    for _ in range(3):
+        next(results)
+    results.close()
+    
+    # 2 * max_workers submitted up front, one more per entity yielded
+    assert len(consumed) <= 2 * 4 + 3
@@ -0,0 +1,32 @@
+"""Unit tests for environment variable utilities."""
+import pytest
+from utils.env import clear_env_cache, get_env_var
+
+def test_get_env_var(monkeypatch):
+    """Set variables should be returned, unset ones should raise if required."""
+    monkeypatch.setenv('KB_TEST_VAR', 'value')
+    monkeypatch.delenv('KB_TEST_MISSING', raising=False)
+    
+    assert get_env_var('KB_TEST_VAR') == 'value'
+    assert get_env_var('KB_TEST_MISSING', required=False) is None
+    with pytest.raises(RuntimeError, match='KB_TEST_MISSING'):
+        get_env_var('KB_TEST_MISSING')
+
+def test_set_values_are_cached(monkeypatch):
+    """A set value should be served from the cache until it is cleared."""
+    monkeypatch.setenv('KB_TEST_VAR', 'first')
+    assert get_env_var('KB_TEST_VAR') == 'first'
+    
+    monkeypatch.setenv('KB_TEST_VAR', 'second')
+    assert get_env_var('KB_TEST_VAR') == 'first'
+    
+    clear_env_cache()
+    assert get_env_var('KB_TEST_VAR') == 'second'
+
+def test_unset_values_are_not_cached(monkeypatch):
+    """A variable set after a failed lookup should be picked up."""
+    monkeypatch.delenv('KB_TEST_VAR', raising=False)
+    assert get_env_var('KB_TEST_VAR', required=False) is None
+    
+    monkeypatch.setenv('KB_TEST_VAR', 'value')
+    assert get_env_var('KB_TEST_VAR') == 'value'
@@ -1,8 +1,11 @@
+import base64
 import os
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from datetime import datetime
 
+from sources.gmail_source import MESSAGE_FIELDS, GmailSource, _b64decode
+
 @pytest.fixture
 def gmail_config():
     return {
@@ -38,41 +41,139 @@ def mock_gmail_message():
         }
     }
 
-def test_smoke_gmail(gmail_config, mock_gmail_list, mock_gmail_message):
+def test_smoke_gmail(gmail_config, gmail_service, mock_gmail_list, mock_gmail_message):
     """Smoke test for Gmail connector."""
-    with patch('googleapiclient.discovery.build') as mock_build, \
-         patch('google.oauth2.credentials.Credentials') as mock_creds:
-        
-        # Mock credentials
-        mock_creds.return_value.refresh.return_value = None
-        
-        # Mock Gmail service
-        mock_service = Mock()
-        mock_build.return_value = mock_service
-        
-        # Mock messages API
-        mock_messages = Mock()
-        mock_messages.list().execute.return_value = mock_gmail_list
-        mock_messages.get().execute.return_value = mock_gmail_message
-        
-        # Mock users().messages() chain
-        mock_users = Mock()
-        mock_users.messages.return_value = mock_messages
-        mock_service.users.return_value = mock_users
+    # Mock messages API
+    mock_messages = Mock()
+    mock_messages.list().execute.return_value = mock_gmail_list
+    mock_messages.get().execute.return_value = mock_gmail_message
+    
+    # Mock users().messages() chain
+    mock_users = Mock()
+    mock_users.messages.return_value = mock_messages
+    gmail_service.users.return_value = mock_users
+
+    source = GmailSource(gmail_config)
+    
+    # Should list messages
+    messages = list(source.list_entities())
+    assert len(messages) == 2
+    assert messages[0] == 'msg1'
+    
+    # Should get message content
+    chunks = list(source.iter_content('msg1'))
+    assert len(chunks) == 1
+    chunk = chunks[0]
+    assert 'Test email content' in chunk.content
+    assert chunk.metadata['source'] == 'gmail'
+    assert chunk.metadata['id'] == 'msg1'
+    assert chunk.metadata['subject'] == 'Test Subject'
+    
+    # Only the fields the parser reads are requested
+    assert mock_messages.get.call_args.kwargs['fields'] == MESSAGE_FIELDS
+
+def test_gmail_list_pagination(gmail_config, gmail_service):
+    """list_entities should follow nextPageToken across pages."""
+    mock_messages = Mock()
+    mock_messages.list.return_value.execute.side_effect = [
+        {'messages': [{'id': 'msg1'}, {'id': 'msg2'}], 'nextPageToken': 'page2'},
+        {'messages': [{'id': 'msg3'}]}
+    ]
+    gmail_service.users.return_value.messages.return_value = mock_messages
+    
+    source = GmailSource(gmail_config)
+    
+    assert list(source.list_entities()) == ['msg1', 'msg2', 'msg3']
+    assert mock_messages.list.call_args_list[1].kwargs['pageToken'] == 'page2'
 
-        from sources.gmail_source import GmailSource
-        source = GmailSource(gmail_config)
+class FakeBatch:
+    """Stand-in for BatchHttpRequest that answers every call on execute()."""
+    
+    def __init__(self, callback, response, failing_ids=()):
+        self.callback = callback
+        self.response = response
+        self.failing_ids = set(failing_ids)
+        self.requests = []
+        self.execute_count = 0
         
-        # Should list messages
-        messages = list(source.list_entities())
-        assert len(messages) == 2
-        assert messages[0] == 'msg1'
+    def add(self, request, request_id):
+        self.requests.append(request_id)
         
-        # Should get message content
-        chunks = list(source.iter_content('msg1'))
-        assert len(chunks) == 1
-        chunk = chunks[0]
-        assert 'Test email content' in chunk.content
-        assert chunk.metadata['source'] == 'gmail'
-        assert chunk.metadata['id'] == 'msg1'
-        assert chunk.metadata['subject'] == 'Test Subject'
+    def execute(self):
+        self.execute_count += 1
+        for request_id in self.requests:
+            if request_id in self.failing_ids:
+                self.callback(request_id, None, Exception('Rate limit exceeded'))
+            else:
+                self.callback(request_id, self.response, None)
+
+@pytest.fixture
+def gmail_batch_source(gmail_config, gmail_service, mock_gmail_message):
+    """GmailSource whose batches are served by FakeBatch objects."""
+    batches = []
+    
+    def new_batch(callback):
+        batches.append(FakeBatch(callback, mock_gmail_message))
+        return batches[-1]
+    
+    gmail_service.new_batch_http_request.side_effect = new_batch
+    
+    return GmailSource(gmail_config), gmail_service, batches
+
+def test_gmail_batched_reads(gmail_batch_source):
+    """iter_contents should fetch many messages with one batch execute."""
+    source, mock_service, batches = gmail_batch_source
+    
+    results = list(source.iter_contents(['msg1', 'msg2', 'msg3']))
+    assert len(batches) == 1
+    assert batches[0].execute_count == 1
+    assert [chunks[0].metadata['id'] for chunks in results] == ['msg1', 'msg2', 'msg3']
+    assert 'Test email content' in results[0][0].content
+    mock_service.users.return_value.messages.return_value.get.return_value.execute.assert_not_called()
+
+def test_gmail_batch_size_limits(gmail_batch_source):
+    """Batches should respect batch_size and never exceed Gmail's limit."""
+    source, _, batches = gmail_batch_source
+    
+    list(source.iter_contents(['msg1', 'msg2', 'msg3'], batch_size=2))
+    assert [len(batch.requests) for batch in batches] == [2, 1]
+    
+    batches.clear()
+    list(source.iter_contents([f'msg{i}' for i in range(150)], batch_size=500))
+    assert [len(batch.requests) for batch in batches] == [100, 50]
+
+def test_gmail_batch_fallback(gmail_batch_source, mock_gmail_message):
+    """Messages that fail inside a batch should be refetched one by one."""
+    source, mock_service, batches = gmail_batch_source
+    mock_get = mock_service.users.return_value.messages.return_value.get
+    mock_get.return_value.execute.return_value = mock_gmail_message
+    
+    original_new_batch = mock_service.new_batch_http_request.side_effect
+    
+    def failing_batch(callback):
+        batch = original_new_batch(callback)
+        batch.failing_ids = {'1'}
+        return batch
+    
+    mock_service.new_batch_http_request.side_effect = failing_batch
+    
+    results = list(source.iter_contents(['msg1', 'msg2']))
+    assert [chunks[0].metadata['id'] for chunks in results] == ['msg1', 'msg2']
+    mock_get.assert_called_with(userId='me', id='msg2', fields=MESSAGE_FIELDS)
+    assert mock_get.return_value.execute.call_count == 1
+
+def test_b64decode_matches_urlsafe_base64():
+    """Bodies using the URL-safe alphabet should decode like base64.urlsafe_b64decode."""
+    raw = b'\xfb\xff\xbe Test email content \xfa'
+    encoded = base64.urlsafe_b64encode(raw).decode('ascii')
+    assert '-' in encoded or '_' in encoded
+    assert _b64decode(encoded) == raw == base64.urlsafe_b64decode(encoded)
+
+def test_http_cache_opt_in(gmail_config, gmail_service, tmp_path):
+    """Responses are only cached on disk when a cache directory is configured."""
+    assert GmailSource(gmail_config)._http.http.cache is None
+    
+    cache_dir = tmp_path / 'httpcache'
+    source = GmailSource({**gmail_config, 'http_cache_dir': str(cache_dir)})
+    assert source._http.http.cache is not None
+    assert cache_dir.is_dir()
@@ -1,8 +1,12 @@
 import os
 import pytest
-from unittest.mock import Mock, patch
+import responses
 from datetime import datetime
 
+from sources.outlook_source import OutlookSource
+
+MESSAGES_URL = 'https://graph.microsoft.com/v1.0/me/messages'
+
 @pytest.fixture
 def outlook_config():
     return {
@@ -38,29 +42,52 @@ def mock_outlook_message():
         'receivedDateTime': '2023-07-13T10:00:00Z'
     }
 
-def test_smoke_outlook(outlook_config, mock_outlook_list, mock_outlook_message):
+@responses.activate
+def test_smoke_outlook(outlook_config, mock_msal, mock_outlook_list, mock_outlook_message):
     """Smoke test for Outlook connector."""
-    with patch('msal.ConfidentialClientApplication') as mock_msal:
-        mock_msal.return_value.acquire_token_silent.return_value = {'access_token': 'test-token'}
-        
-        with patch('requests.get') as mock_get:
-            # Mock list messages
-            mock_get.return_value.json.side_effect = [mock_outlook_list, mock_outlook_message]
-            mock_get.return_value.ok = True
+    responses.add(responses.GET, MESSAGES_URL, json=mock_outlook_list, status=200)
+    responses.add(responses.GET, f'{MESSAGES_URL}/msg1', json=mock_outlook_message, status=200)
+    
+    source = OutlookSource(outlook_config)
+    
+    # Should list messages
+    messages = list(source.list_entities())
+    assert len(messages) == 2
+    assert messages[0] == 'msg1'
+    
+    # Should get message content
+    chunks = list(source.iter_content('msg1'))
+    assert len(chunks) == 1
+    chunk = chunks[0]
+    assert 'Test email content' in chunk.content
+    assert chunk.metadata['source'] == 'outlook'
+    assert chunk.metadata['id'] == 'msg1'
+    assert chunk.metadata['subject'] == 'Test Email 1'
+    assert responses.calls[0].request.headers['Authorization'] == 'Bearer test-token'
+
+@responses.activate
+def test_outlook_concurrent_contents(outlook_config, mock_msal, mock_outlook_message):
+    """iter_contents should fetch several messages and keep their order."""
+    message_ids = ['msg1', 'msg2', 'msg3']
+    for message_id in message_ids:
+        responses.add(
+            responses.GET,
+            f'{MESSAGES_URL}/{message_id}',
+            json={**mock_outlook_message, 'id': message_id, 'subject': f'Subject {message_id}'}
+        )
+    
+    source = OutlookSource(outlook_config)
+    
+    results = list(source.iter_contents(message_ids))
+    assert [chunks[0].metadata['subject'] for chunks in results] == [
+        'Subject msg1', 'Subject msg2', 'Subject msg3'
+    ]
+    assert len(responses.calls) == 3
 
-            from sources.outlook_source import OutlookSource
-            source = OutlookSource(outlook_config)
-            
-            # Should list messages
-            messages = list(source.list_entities())
-            assert len(messages) == 2
-            assert messages[0] == 'msg1'
-            
-            # Should get message content
-            chunks = list(source.iter_content('msg1'))
-            assert len(chunks) == 1
-            chunk = chunks[0]
-            assert 'Test email content' in chunk.content
-            assert chunk.metadata['source'] == 'outlook'
-            assert chunk.metadata['id'] == 'msg1'
-            assert chunk.metadata['subject'] == 'Test Email 1'
+def test_outlook_shares_msal_app(outlook_config, mock_msal):
+    """Sources with the same credentials should reuse one MSAL app."""
+    first = OutlookSource(outlook_config)
+    second = OutlookSource(outlook_config)
+    
+    assert first.app is second.app
+    assert mock_msal.call_count == 1
@@ -3,10 +3,10 @@ import pytest
 import pyarrow as pa
 import pyarrow.parquet as pq
 from pathlib import Path
-from tools.airweave_loader import load_parquet
+from tools.airweave_loader import iter_parquet, load_parquet
 
-@pytest.fixture
-def test_parquet_file(tmp_path):
+@pytest.fixture(scope="session")
+def test_parquet_file(tmp_path_factory):
     """Create a test Parquet file with sample data."""
     # Create sample data
     data = {
@@ -20,14 +20,14 @@ def test_parquet_file(tmp_path):
     table = pa.Table.from_pydict(data)
     
     # Write to temporary file
-    test_file = tmp_path / "test.parquet"
+    test_file = tmp_path_factory.mktemp("pq") / "test.parquet"
     pq.write_table(table, str(test_file))
     
     return test_file
 
 def test_load_parquet(test_parquet_file):
     """Test loading records from a Parquet file."""
-    records = load_parquet(test_parquet_file)
+    records = list(load_parquet(test_parquet_file))
     
     # Verify number of records
     assert len(records) == 3
@@ -43,8 +43,9 @@ def test_load_parquet(test_parquet_file):
     # Verify null handling
     assert records[2]['name'] == ''  # None should be converted to empty string
 
-def test_load_parquet_empty_file(tmp_path):
-    """Test loading an empty Parquet file."""
+@pytest.fixture(scope="session")
+def empty_parquet_file(tmp_path_factory):
+    """Create an empty Parquet file."""
     # Create empty table
     table = pa.Table.from_pydict({
         'id': [],
@@ -53,14 +54,36 @@ def test_load_parquet_empty_file(tmp_path):
     })
     
     # Write empty table
-    test_file = tmp_path / "empty.parquet"
+    test_file = tmp_path_factory.mktemp("pq") / "empty.parquet"
     pq.write_table(table, str(test_file))
     
-    # Load and verify
-    records = load_parquet(test_file)
+    return test_file
+
+def test_load_parquet_empty_file(empty_parquet_file):
+    """Test loading an empty Parquet file."""
+    records = list(load_parquet(empty_parquet_file))
     assert len(records) == 0
 
 def test_load_parquet_file_not_found():
     """Test error handling for non-existent file."""
     with pytest.raises(FileNotFoundError):
-        load_parquet(Path("nonexistent.parquet"))
+        list(load_parquet(Path("nonexistent.parquet")))
+
+def test_iter_parquet_streams_batches(tmp_path):
+    """iter_parquet should read lazily in batches and keep null handling."""
+    num_rows = 100_000
+    table = pa.Table.from_pydict({
+        'id': list(range(num_rows)),
+        'name': [None if i % 10 == 0 else f'user{i}' for i in range(num_rows)]
+    })
+    test_file = tmp_path / "large.parquet"
+    pq.write_table(table, str(test_file), row_group_size=10_000)
+    
+    records = iter_parquet(test_file, batch_size=1000)
+    
+    # First record is available without reading the whole file
+    assert next(records) == {'id': 0, 'name': ''}
+    assert next(records) == {'id': 1, 'name': 'user1'}
+    
+    remaining = sum(1 for _ in records)
+    assert remaining == num_rows - 2
@@ -1,8 +1,11 @@
+import json
 import os
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 from datetime import datetime
 
+from sources.postgres_source import PostgresSource
+
 @pytest.fixture
 def postgres_config():
     return {
@@ -39,7 +42,14 @@ def mock_postgres_data():
         {'email': 'user2@example.com', 'name': 'Jane Smith', 'created_at': '2023-07-13'}
     ]
 
-def test_smoke_postgres(postgres_config, mock_postgres_tables, mock_postgres_data):
+@pytest.fixture
+def mock_postgres_order_data():
+    return [
+        {'order_id': 1001, 'user_id': 1, 'product': 'Product A', 'amount': 100.00},
+        {'order_id': 1002, 'user_id': 2, 'product': 'Product B', 'amount': 200.00}
+    ]
+
+def test_smoke_postgres(postgres_config, mock_postgres_data, mock_postgres_order_data):
     """Smoke test for Postgres connector."""
     with patch('psycopg2.connect') as mock_connect:
         # Mock connection
@@ -50,23 +60,15 @@ def test_smoke_postgres(postgres_config, mock_postgres_tables, mock_postgres_dat
         mock_conn.__enter__ = Mock(return_value=mock_conn)
         mock_conn.__exit__ = Mock(return_value=None)
         
-        # Mock cursor
-        mock_cursor = Mock()
+        # Mock cursor returning (row_count, jsonb_agg blob) per table
+        mock_cursor = MagicMock()
         mock_conn.cursor.return_value = mock_cursor
-        
-        # Mock cursor context manager
-        mock_cursor.__enter__ = Mock(return_value=mock_cursor)
-        mock_cursor.__exit__ = Mock(return_value=None)
-        
-        # Configure mock cursor responses
-        mock_cursor.fetchall.side_effect = [mock_postgres_tables, mock_postgres_data]
-        mock_cursor.description = [
-            ('email',), ('name',), ('created_at',)
-        ]
         mock_cursor.__enter__.return_value = mock_cursor
-        mock_cursor.__exit__.return_value = None
+        mock_cursor.fetchone.side_effect = [
+            (len(mock_postgres_data), json.dumps(mock_postgres_data)),
+            (len(mock_postgres_order_data), json.dumps(mock_postgres_order_data))
+        ]
 
-        from sources.postgres_source import PostgresSource
         source = PostgresSource(postgres_config)
         
         # Should list tables
@@ -89,3 +91,31 @@ def test_smoke_postgres(postgres_config, mock_postgres_tables, mock_postgres_dat
         assert 'Product A' in chunk.content
         assert chunk.metadata['source'] == 'postgres'
         assert chunk.metadata['table'] == 'orders'
+        
+        assert chunk.metadata['row_count'] == 2
+        
+        # Rows are aggregated in SQL rather than fetched one by one
+        assert json.loads(chunk.content) == mock_postgres_order_data
+        mock_cursor.fetchall.assert_not_called()
+
+def test_postgres_iter_contents_single_round_trip(postgres_config, mock_postgres_data):
+    """iter_contents should fetch every table with one statement."""
+    with patch('psycopg2.connect') as mock_connect:
+        mock_cursor = MagicMock()
+        mock_connect.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+        
+        # Rows may come back in any order; empty tables aggregate to (0, None)
+        mock_cursor.fetchall.return_value = [
+            (1, 0, None),
+            (0, len(mock_postgres_data), json.dumps(mock_postgres_data))
+        ]
+        
+        source = PostgresSource(postgres_config)
+        results = list(source.iter_contents(['users', 'orders']))
+        
+        assert mock_connect.call_count == 1
+        assert mock_cursor.execute.call_count == 1
+        assert len(results) == 2
+        assert results[0][0].metadata['table'] == 'users'
+        assert 'user1@example.com' in results[0][0].content
+        assert results[1] == []
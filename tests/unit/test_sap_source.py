@@ -1,17 +1,25 @@
 import os
+import orjson
 import pytest
+import requests
+import responses
 from unittest.mock import Mock, patch
+from urllib.parse import parse_qs
 from datetime import datetime, timedelta
 
 from sources.sap_source import SAPSource
 
+TOKEN_URL = 'https://sap-test.example.com/oauth/token'
+SERVICE_URL = 'https://sap-test.example.com/sap/opu/odata/sap/ZKB_PO_SRV'
+
 @pytest.fixture
-def sap_config():
+def sap_config(tmp_path):
     return {
         'base_url': 'https://sap-test.example.com',
         'client_id': 'test-client',
         'client_secret': 'test-secret',
-        'service_path': '/sap/opu/odata/sap/ZKB_PO_SRV'
+        'service_path': '/sap/opu/odata/sap/ZKB_PO_SRV',
+        'cache_path': str(tmp_path / 'sap_cache')
     }
 
 @pytest.fixture
@@ -22,6 +30,20 @@ def mock_token_response():
         'token_type': 'Bearer'
     }
 
+@pytest.fixture
+def mock_http(mock_token_response):
+    """Intercept HTTP calls at the transport level with a registered token endpoint."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(responses.POST, TOKEN_URL, json=mock_token_response, status=200)
+        yield rsps
+
+@pytest.fixture
+def sap_source(sap_config, mock_http, monkeypatch):
+    """SAPSource using the live request path against mocked HTTP."""
+    monkeypatch.setenv('SAP_MOCK', 'false')
+    monkeypatch.setattr('sources.sap_source._TOKEN_CACHE', {})
+    return SAPSource(sap_config)
+
 @pytest.fixture
 def mock_po_list_response():
     return {
@@ -71,6 +93,9 @@ def test_default_config():
     assert source.client_id == 'demo'
     assert source.client_secret == 'demo'
     assert source.use_mock == True
+    
+    # The cache file is only opened for live requests
+    assert source._session is None
 
 def test_mock_mode_enabled(sap_config):
     """Test that mock mode works correctly."""
@@ -87,142 +112,118 @@ def test_mock_mode_enabled(sap_config):
         assert len(pos) == 1
         assert pos[0] == '4500000001'
 
-def test_auth_token_retrieval(sap_config, mock_token_response):
+def token_calls(mock_http):
+    """Return the calls made to the token endpoint."""
+    return [call for call in mock_http.calls if call.request.url == TOKEN_URL]
+
+def test_auth_token_retrieval(sap_source, mock_http):
     """Test OAuth2 token retrieval and caching."""
-    with patch.dict(os.environ, {'SAP_MOCK': 'false'}):
-        with patch('requests.post') as mock_post:
-            mock_post.return_value.json.return_value = mock_token_response
-            mock_post.return_value.ok = True
-            
-            source = SAPSource(sap_config)
-            token = source._get_auth_token()
-            
-            assert token == 'test-token'
-            mock_post.assert_called_once_with(
-                'https://sap-test.example.com/oauth/token',
-                data={
-                    'grant_type': 'client_credentials',
-                    'client_id': 'test-client',
-                    'client_secret': 'test-secret'
-                },
-                headers={'Accept': 'application/json'}
-            )
+    token = sap_source._get_auth_token()
+    
+    assert token == 'test-token'
+    calls = token_calls(mock_http)
+    assert len(calls) == 1
+    assert parse_qs(calls[0].request.body) == {
+        'grant_type': ['client_credentials'],
+        'client_id': ['test-client'],
+        'client_secret': ['test-secret']
+    }
+    assert calls[0].request.headers['Accept'] == 'application/json'
 
-def test_token_caching():
+def test_token_caching(sap_source, mock_http):
     """Test that tokens are cached and reused."""
-    with patch.dict(os.environ, {'SAP_MOCK': 'false'}):
-        with patch('requests.post') as mock_post:
-            mock_response = Mock()
-            mock_response.json.return_value = {'access_token': 'test-token', 'expires_in': 3600}
-            mock_response.ok = True
-            mock_post.return_value = mock_response
-            
-            source = SAPSource({
-                'base_url': 'https://sap-test.example.com',
-                'client_id': 'test-client',
-                'client_secret': 'test-secret'
-            })
-            
-            # Reset mock call count
-            mock_post.reset_mock()
-            
-            # First call should get token
-            token1 = source._get_auth_token()
-            assert token1 == 'test-token'
-            assert mock_post.call_count == 1
-            
-            # Second call should reuse cached token
-            token2 = source._get_auth_token()
-            assert token2 == 'test-token'
-            assert mock_post.call_count == 1
+    # First call should get token
+    token1 = sap_source._get_auth_token()
+    assert token1 == 'test-token'
+    assert len(token_calls(mock_http)) == 1
+    
+    # Second call should reuse cached token
+    token2 = sap_source._get_auth_token()
+    assert token2 == 'test-token'
+    assert len(token_calls(mock_http)) == 1
+
+def test_token_shared_across_instances(sap_source, sap_config, mock_http):
+    """Sources for the same SAP tenant should share one token."""
+    other_source = SAPSource(sap_config)
+    
+    assert sap_source._get_auth_token() == 'test-token'
+    assert other_source._get_auth_token() == 'test-token'
+    assert len(token_calls(mock_http)) == 1
 
-def test_list_entities(sap_config, mock_po_list_response):
+def test_list_entities(sap_source, mock_http, mock_po_list_response):
     """Test listing available purchase orders."""
-    with patch('requests.post') as mock_post, patch('requests.get') as mock_get:
-        # Mock token response
-        mock_token_resp = Mock()
-        mock_token_resp.json.return_value = {'access_token': 'test-token', 'expires_in': 3600}
-        mock_token_resp.ok = True
-        mock_post.return_value = mock_token_resp
-        
-        # Mock list response
-        mock_list_resp = Mock()
-        mock_list_resp.json.return_value = {
-            'd': {
-                'results': [
-                    {
-                        'PurchaseOrder': '4500000001',
-                        'CompanyCode': '1000',
-                        'DocumentType': 'NB',
-                        'CreatedAt': '/Date(1689254400000)/',
-                        'Supplier': '100602',
-                        'Status': 'Open'
-                    }
-                ]
-            }
-        }
-        mock_list_resp.ok = True
-        mock_get.return_value = mock_list_resp
-        
-        source = SAPSource(sap_config)
-        entities = list(source.list_entities())
-        
-        assert len(entities) == 1
-        assert entities[0] == '4500000001'
+    mock_http.add(responses.GET, f'{SERVICE_URL}/PurchaseOrders', body=orjson.dumps(mock_po_list_response))
+    
+    entities = list(sap_source.list_entities())
+    
+    assert len(entities) == 1
+    assert entities[0] == '4500000001'
+    assert mock_http.calls[-1].request.headers['Authorization'] == 'Bearer test-token'
 
-def test_iter_content(sap_config, mock_po_detail_response):
+def test_iter_content(sap_source, mock_http, mock_po_detail_response):
     """Test retrieving purchase order content."""
-    with patch('requests.post') as mock_post, patch('requests.get') as mock_get:
-        # Mock token response
-        mock_token_resp = Mock()
-        mock_token_resp.json.return_value = {'access_token': 'test-token', 'expires_in': 3600}
-        mock_token_resp.ok = True
-        mock_post.return_value = mock_token_resp
-        
-        # Mock content response
-        mock_content_resp = Mock()
-        mock_content_resp.json.return_value = {
-            'd': {
-                'PurchaseOrder': '4500000001',
-                'CompanyCode': '1000',
-                'DocumentType': 'NB',
-                'CreatedAt': '/Date(1689254400000)/',
-                'Supplier': '100602',
-                'Status': 'Open',
-                'Items': {
-                    'results': [
-                        {
-                            'ItemNumber': '00010',
-                            'Material': 'MAT001',
-                            'Description': 'Test Material',
-                            'Quantity': '100.000',
-                            'Unit': 'EA',
-                            'DeliveryDate': '/Date(1689340800000)/'
-                        }
-                    ]
-                }
-            }
-        }
-        mock_content_resp.ok = True
-        mock_get.return_value = mock_content_resp
-        
-        source = SAPSource(sap_config)
-        chunks = list(source.iter_content('4500000001'))
-        
-        assert len(chunks) == 1
-        chunk = chunks[0]
-        
-        # Check content formatting
-        assert '4500000001' in chunk.content
-        assert 'Company: 1000' in chunk.content
-        assert 'Supplier: 100602' in chunk.content
-        assert 'Item 00010: 100.000 EA of Test Material' in chunk.content
-        
-        # Check metadata
-        assert chunk.metadata['source'] == 'sap_s4hana'
-        assert chunk.metadata['id'] == '4500000001'
-        assert chunk.metadata['supplier'] == '100602'
-        assert chunk.metadata['status'] == 'Open'
+    mock_http.add(
+        responses.GET,
+        f'{SERVICE_URL}/PurchaseOrders(4500000001)',
+        body=orjson.dumps(mock_po_detail_response)
+    )
+    
+    chunks = list(sap_source.iter_content('4500000001'))
+    
+    assert len(chunks) == 1
+    chunk = chunks[0]
+    
+    # Check content formatting
+    assert '4500000001' in chunk.content
+    assert 'Company: 1000' in chunk.content
+    assert 'Supplier: 100602' in chunk.content
+    assert 'Item 00010: 100.000 EA of Test Material' in chunk.content
+    
+    # Check metadata
+    assert chunk.metadata['source'] == 'sap_s4hana'
+    assert chunk.metadata['id'] == '4500000001'
+    assert chunk.metadata['supplier'] == '100602'
+    assert chunk.metadata['status'] == 'Open'
+
+def test_iter_content_revalidates_cached_po(sap_source, mock_http, mock_po_detail_response):
+    """Repeated PO reads should be served from cache after a 304."""
+    url = f'{SERVICE_URL}/PurchaseOrders(4500000001)'
+    mock_http.add(responses.GET, url, body=orjson.dumps(mock_po_detail_response), headers={'ETag': '"po-v1"'})
+    mock_http.add(responses.GET, url, status=304, headers={'ETag': '"po-v1"'})
+    
+    first = list(sap_source.iter_content('4500000001'))
+    second = list(sap_source.iter_content('4500000001'))
+    
+    assert second == first
+    get_calls = [call for call in mock_http.calls if call.request.url == url]
+    assert len(get_calls) == 2
+    assert get_calls[1].request.headers['If-None-Match'] == '"po-v1"'
+    assert get_calls[1].response.status_code == 304
+
+def test_iter_content_raises_instead_of_serving_stale_po(sap_source, mock_http, mock_po_detail_response):
+    """A failed revalidation should raise, not return the cached PO."""
+    url = f'{SERVICE_URL}/PurchaseOrders(4500000001)'
+    mock_http.add(responses.GET, url, body=orjson.dumps(mock_po_detail_response), headers={'ETag': '"po-v1"'})
+    mock_http.add(responses.GET, url, status=503)
+    
+    list(sap_source.iter_content('4500000001'))
+    with pytest.raises(requests.HTTPError):
+        list(sap_source.iter_content('4500000001'))
+
+def test_make_request_parses_raw_body(sap_source, mock_http, monkeypatch):
+    """Test that live responses are parsed from the raw response bytes."""
+    mock_http.add(
+        responses.GET,
+        f'{SERVICE_URL}/PurchaseOrders',
+        body=b'{"d": {"results": [{"PurchaseOrder": "4500000001"}]}}'
+    )
+    response_json = Mock()
+    monkeypatch.setattr(requests.Response, 'json', response_json)
+    
+    entities = list(sap_source.list_entities())
+    
+    assert entities == ['4500000001']
+    response_json.assert_not_called()
 
 @pytest.mark.skipif(not os.getenv('SAP_TEST'), reason='SAP integration tests require SAP_TEST=1')
 def test_integration_real_sap():
@@ -1,32 +1,24 @@
 import os
 import pytest
+import responses
 from unittest.mock import patch, Mock
 
-@pytest.fixture
-def mock_google_services():
-    """Mock Google API services."""
-    # Gmail service
-    mock_gmail_service = Mock()
-    mock_gmail_messages = Mock()
-    mock_gmail_messages.list().execute.return_value = {'messages': [{'id': 'msg1'}]}
-    mock_gmail_service.users().messages = mock_gmail_messages
-    
-    # Drive service
-    mock_drive_service = Mock()
-    mock_drive_files = Mock()
-    mock_drive_files.list().execute.return_value = {'files': [{'id': 'file1'}]}
-    mock_drive_service.files = mock_drive_files
-    
-    return mock_gmail_service, mock_drive_service
+from sources.sap_source import SAPSource
+from sources.gmail_source import GmailSource
+from sources.outlook_source import OutlookSource
+from sources.gdrive_source import GDriveSource
+from sources.onedrive_source import OneDriveSource
+from sources.postgres_source import PostgresSource
 
 @pytest.fixture
-def mock_configs():
+def mock_configs(tmp_path):
     """Test configs with mock credentials."""
     return {
         'sap': {
             'base_url': 'https://sap-test.example.com',
             'client_id': 'test-client',
-            'client_secret': 'test-secret'
+            'client_secret': 'test-secret',
+            'cache_path': str(tmp_path / 'sap_cache')
         },
         'gmail': {
             'credentials_json': {
@@ -74,72 +66,68 @@ def mock_responses():
         'postgres': [('users',), ('orders',)]
     }
 
-def test_all_connectors(mock_google_services, mock_configs, mock_responses):
-    """Smoke test all connectors to verify they can list and retrieve content."""
-    
-    # Import all source modules
-    from sources.sap_source import SAPSource
-    from sources.gmail_source import GmailSource
-    from sources.outlook_source import OutlookSource
-    from sources.gdrive_source import GDriveSource
-    from sources.onedrive_source import OneDriveSource
-    from sources.postgres_source import PostgresSource
-    
-    mock_gmail_service, mock_drive_service = mock_google_services
+@pytest.fixture
+def mock_graph(mock_msal, mock_responses):
+    """Serve the Microsoft Graph listing endpoints."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock_http:
+        mock_http.add(responses.GET, 'https://graph.microsoft.com/v1.0/me/messages',
+                      json=mock_responses['outlook'])
+        mock_http.add(responses.GET, 'https://graph.microsoft.com/v1.0/me/drive/root/children',
+                      json=mock_responses['onedrive'])
+        yield mock_http
+
+@pytest.fixture
+def mock_sap(mock_configs, mock_responses, monkeypatch):
+    """Serve the SAP token and purchase order endpoints."""
+    monkeypatch.setenv('SAP_MOCK', 'false')
+    sap_url = mock_configs['sap']['base_url']
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock_http:
+        mock_http.add(responses.POST, f'{sap_url}/oauth/token',
+                      json={'access_token': 'test-token', 'expires_in': 3600})
+        mock_http.add(responses.GET, f'{sap_url}/sap/opu/odata/sap/ZKB_PO_SRV/PurchaseOrders',
+                      json=mock_responses['sap'])
+        yield mock_http
+
+@pytest.fixture
+def mock_gmail(gmail_service, mock_responses):
+    """Mock the Gmail messages listing."""
+    gmail_messages = gmail_service.users.return_value.messages.return_value
+    gmail_messages.list.return_value.execute.return_value = mock_responses['gmail']
+
+@pytest.fixture
+def mock_gdrive(drive_service, mock_responses):
+    """Mock the Drive files listing."""
+    drive_service.files.return_value.list.return_value.execute.return_value = mock_responses['gdrive']
+
+@pytest.fixture
+def mock_postgres(mock_responses):
+    """Mock the Postgres connection and cursor."""
+    with patch('psycopg2.connect') as mock_pg:
+        mock_cursor = Mock()
+        mock_cursor.fetchall.return_value = mock_responses['postgres']
+        mock_pg.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+        yield mock_pg
+
+# Connector class, config key and the fixture mocking its backend
+CONNECTORS = [
+    (SAPSource, 'sap', 'mock_sap'),
+    (GmailSource, 'gmail', 'mock_gmail'),
+    (OutlookSource, 'outlook', 'mock_graph'),
+    (GDriveSource, 'gdrive', 'mock_gdrive'),
+    (OneDriveSource, 'onedrive', 'mock_graph'),
+    (PostgresSource, 'postgres', 'mock_postgres')
+]
+
+@pytest.mark.parametrize(
+    "source_cls,config_key,mock_fixture",
+    CONNECTORS,
+    ids=[config_key for _, config_key, _ in CONNECTORS]
+)
+def test_connector(source_cls, config_key, mock_fixture, mock_configs, request):
+    """Smoke test a connector to verify it can list entities."""
+    # Install only the mocks this connector needs
+    request.getfixturevalue(mock_fixture)
     
-    # Test each source
-    with patch.dict(os.environ, {'SAP_MOCK': 'false'}):
-        with patch('requests.get') as mock_get, \
-             patch('requests.post') as mock_post, \
-             patch('googleapiclient.discovery.build') as mock_build, \
-             patch('msal.ConfidentialClientApplication') as mock_msal, \
-             patch('psycopg2.connect') as mock_pg, \
-             patch('google.oauth2.credentials.Credentials') as mock_creds:
-            
-            # Configure mocks
-            mock_get.return_value.json.return_value = mock_responses['sap']
-            mock_get.return_value.ok = True
-            mock_post.return_value.json.return_value = {'access_token': 'test-token', 'expires_in': 3600}
-            mock_post.return_value.ok = True
-            
-            # Mock Google API
-            mock_build.return_value = mock_gmail_service
-            mock_creds.return_value.refresh.return_value = None
-            
-            # Mock MSAL
-            mock_msal.return_value.acquire_token_silent.return_value = {'access_token': 'test-token'}
-            
-            # Mock Postgres cursor
-            mock_cursor = Mock()
-            mock_cursor.fetchall.return_value = mock_responses['postgres']
-            mock_pg.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value = mock_cursor
-            
-            # Test SAP
-            source = SAPSource(mock_configs['sap'])
-            entities = list(source.list_entities())
-            assert len(entities) > 0
-            
-            # Test Gmail 
-            source = GmailSource(mock_configs['gmail'])
-            entities = list(source.list_entities())
-            assert len(entities) > 0
-            
-            # Test Outlook
-            source = OutlookSource(mock_configs['outlook'])
-            entities = list(source.list_entities())
-            assert len(entities) > 0
-            
-            # Test Google Drive
-            source = GDriveSource(mock_configs['gdrive'])
-            entities = list(source.list_entities())
-            assert len(entities) > 0
-            
-            # Test OneDrive
-            source = OneDriveSource(mock_configs['onedrive'])
-            entities = list(source.list_entities())
-            assert len(entities) > 0
-            
-            # Test Postgres
-            source = PostgresSource(mock_configs['postgres'])
-            entities = list(source.list_entities())
-            assert len(entities) > 0
+    source = source_cls(mock_configs[config_key])
+    entities = list(source.list_entities())
+    assert len(entities) > 0
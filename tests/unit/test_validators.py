@@ -1,6 +1,8 @@
 """Unit tests for data validators."""
 import pytest
+from unittest.mock import patch
 from datetime import datetime
+from pydantic import ValidationError
 from validators.schema import SchemaValidator
 from validators.quality import QualityChecker
 
@@ -66,6 +68,39 @@ class TestSchemaValidator:
         data_list = [valid_email_data, valid_email_data]
         validated = SchemaValidator.validate_batch(data_list, 'email')
         assert len(validated) == 2
+        assert validated[0] == SchemaValidator.validate(valid_email_data, 'email')
+
+    def test_validate_batch_skips_invalid(self, valid_po_data):
+        """Invalid items are skipped; an unknown schema type still raises."""
+        invalid = {**valid_po_data, 'total_amount': 'n/a'}
+        data_list = [invalid, valid_po_data, invalid, {**valid_po_data, 'po_number': 'PO999'}]
+        validated = SchemaValidator.validate_batch(data_list, 'purchase_order')
+        assert [item['po_number'] for item in validated] == [valid_po_data['po_number'], 'PO999']
+        
+        with pytest.raises(ValueError):
+            SchemaValidator.validate_batch(data_list, 'invalid_type')
+
+
+    def test_validate_batch_in_chunks(self, valid_po_data):
+        """Slices should be validated in order, skipping invalid items in any of them."""
+        data_list = [{**valid_po_data, 'po_number': f'PO{i:03d}'} for i in range(7)]
+        data_list[4]['total_amount'] = 'n/a'
+        with patch('validators.schema.VALIDATE_CHUNK_SIZE', 3):
+            validated = SchemaValidator.validate_batch(data_list, 'purchase_order')
+        assert [item['po_number'] for item in validated] == ['PO000', 'PO001', 'PO002', 'PO003', 'PO005', 'PO006']
+
+    def test_validate_returns_independent_copies(self, valid_po_data):
+        """Repeated inputs are cached, but callers get their own dicts."""
+        first = SchemaValidator.validate(valid_po_data, 'purchase_order')
+        first['status'] = 'mutated'
+        second = SchemaValidator.validate(valid_po_data, 'purchase_order')
+        assert second['status'] == 'approved'
+
+    def test_validate_unhashable_values(self, valid_po_data):
+        """Unhashable values should fall back to uncached validation."""
+        data = {**valid_po_data, 'items': ['Item1', 'Item2']}
+        with pytest.raises(ValidationError):
+            SchemaValidator.validate(data, 'purchase_order')
 
 class TestQualityChecker:
     def test_check_email_quality(self, valid_email_data):
@@ -80,6 +115,19 @@ class TestQualityChecker:
         assert len(issues) == 1
         assert 'Invalid \'from\' email format' in issues[0]
 
+    @pytest.mark.parametrize("date,valid", [
+        ('2024-01-15T10:30:00Z', True),
+        ('2024-01-15', True),
+        ('20240115T103000', True),
+        ('2024-13-01T00:00:00', False),
+        ('Mon, 15 Jan 2024 10:30:00 +0000', False),
+        ('', False)
+    ])
+    def test_check_email_date_format(self, valid_email_data, date, valid):
+        """Only ISO 8601 date strings should pass the date check."""
+        issues = QualityChecker.check_quality({**valid_email_data, 'date': date}, 'email')
+        assert (not issues) == valid
+
     def test_check_drive_quality(self, valid_drive_data):
         """Test Drive file quality checks."""
         issues = QualityChecker.check_quality(valid_drive_data, 'drive')
@@ -1,57 +1,100 @@
 """Mock Airweave SDK for testing."""
+import logging
+import threading
+from itertools import count
+
+logger = logging.getLogger(__name__)
 
 class AirweaveClient:
-    # Class variable to store documents across instances
-    _documents = []
+    # Class variables to store documents across instances: documents by id,
+    # ids per collection in ingestion order, and ids per
+    # (collection, metadata key, value) for filtering
+    _documents = {}
+    _by_collection = {}
+    _index = {}
+    _ids = count()
+    _lock = threading.Lock()
     
     def __init__(self, api_key: str = "test_key"):
         self.api_key = api_key
-        print(f"\nInitializing AirweaveClient with {len(AirweaveClient._documents)} existing documents")
+        logger.debug("Initializing AirweaveClient with %d existing documents", len(AirweaveClient._documents))
+        
+    @classmethod
+    def _add(cls, collection: str, document: dict):
+        """Store a document and index its hashable metadata values."""
+        document['collection'] = collection
+        doc_id = next(cls._ids)
+        cls._documents[doc_id] = document
+        cls._by_collection.setdefault(collection, []).append(doc_id)
+        for key, value in document.get('metadata', {}).items():
+            try:
+                cls._index.setdefault((collection, key, value), set()).add(doc_id)
+            except TypeError:
+                continue  # Unhashable values are matched by scanning instead
         
     def bulk_ingest(self, collection: str, document: dict):
         """Mock bulk ingestion."""
-        document['collection'] = collection
-        AirweaveClient._documents.append(document)
-        print(f"\nBulk ingested document into {collection}:")
-        print(f"  Content: {document.get('content', '')[:100]}...")
-        print(f"  Metadata: {document.get('metadata', {})}")
-        print(f"Total documents after ingestion: {len(AirweaveClient._documents)}")
+        with AirweaveClient._lock:
+            AirweaveClient._add(collection, document)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Bulk ingested document into %s: content=%.100s... metadata=%s",
+                         collection, document.get('content', ''), document.get('metadata', {}))
+            logger.debug("Total documents after ingestion: %d", len(AirweaveClient._documents))
+        
+    def bulk_ingest_batch(self, collection: str, documents: list):
+        """Mock bulk ingestion of many documents in a single call."""
+        with AirweaveClient._lock:
+            for document in documents:
+                AirweaveClient._add(collection, document)
+        logger.debug("Bulk ingested %d documents into %s", len(documents), collection)
+        logger.debug("Total documents after ingestion: %d", len(AirweaveClient._documents))
         
     def query(self, collection: str, query: dict = None, filters: dict = None):
-        """Mock query functionality."""
-        print(f"\nQuerying collection {collection} with filters {filters}")
-        print(f"Total documents before query: {len(AirweaveClient._documents)}")
+        """Mock query functionality.
         
-        results = []
-        for doc in AirweaveClient._documents:
-            print(f"\nChecking document:")
-            print(f"  Collection: {doc.get('collection')}")
-            print(f"  Content: {doc.get('content', '')[:100]}...")
-            print(f"  Metadata: {doc.get('metadata', {})}")
-            
-            if doc.get('collection') == collection:
-                if filters:
-                    match = True
-                    for key, value in filters.items():
-                        if key not in doc.get('metadata', {}) or doc['metadata'][key] != value:
-                            print(f"  Filter mismatch: {key}={value} not in metadata {doc.get('metadata', {})}")
-                            match = False
-                            break
-                    if match:
-                        print(f"  Document matches all filters, adding to results")
-                        results.append(doc)
-                else:
-                    print(f"  No filters, adding document to results")
-                    results.append(doc)
-            else:
-                print(f"  Collection mismatch: {doc.get('collection')} != {collection}")
+        Filters with hashable values are answered by intersecting the
+        metadata index; any others are checked against the remaining
+        documents one by one.
+        """
+        logger.debug("Querying collection %s with filters %s", collection, filters)
+        logger.debug("Total documents before query: %d", len(AirweaveClient._documents))
         
-        print(f"\nFound {len(results)} matching documents")
+        with AirweaveClient._lock:
+            doc_ids = AirweaveClient._by_collection.get(collection, [])
+            unindexed = {}
+            if filters:
+                matches = None
+                for key, value in filters.items():
+                    try:
+                        ids = AirweaveClient._index.get((collection, key, value), set())
+                    except TypeError:
+                        unindexed[key] = value
+                        continue
+                    matches = ids if matches is None else matches & ids
+                    if not matches:
+                        break
+                if matches is not None:
+                    doc_ids = sorted(matches)
+                    
+            results = [AirweaveClient._documents[doc_id] for doc_id in doc_ids]
+            
+        if unindexed:
+            results = [
+                doc for doc in results
+                if all(key in doc.get('metadata', {}) and doc['metadata'][key] == value
+                       for key, value in unindexed.items())
+            ]
+            
+        logger.debug("Found %d matching documents", len(results))
         return results
         
     def delete_collection(self, collection: str):
         """Mock delete collection."""
-        old_count = len(AirweaveClient._documents)
-        AirweaveClient._documents = [doc for doc in AirweaveClient._documents if doc.get('collection') != collection]
-        new_count = len(AirweaveClient._documents)
-        print(f"\nDeleted collection {collection}: removed {old_count - new_count} documents")
+        with AirweaveClient._lock:
+            doc_ids = AirweaveClient._by_collection.pop(collection, [])
+            for doc_id in doc_ids:
+                del AirweaveClient._documents[doc_id]
+            AirweaveClient._index = {
+                key: ids for key, ids in AirweaveClient._index.items() if key[0] != collection
+            }
+        logger.debug("Deleted collection %s: removed %d documents", collection, len(doc_ids))
@@ -3,15 +3,27 @@
 Airweave Loader CLI for bulk data ingestion.
 """
 import argparse
+import io
+import logging
+import multiprocessing
+import os
+import queue
 import sys
+import threading
 import time
+from functools import partial
+from itertools import chain, islice
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, Iterable, Iterator, List, Dict, Any
 import mailbox
 import csv
 import tqdm
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import pyarrow.parquet as pq
 import json
+import orjson
 from tools.airweave.sdk import AirweaveClient
 from tools.alias_map import AliasMap
 from prometheus_client import Counter, Histogram, start_http_server
@@ -20,110 +32,224 @@ from watchdog.events import FileSystemEventHandler
 from validators.schema import SchemaValidator
 from validators.quality import QualityChecker
 
+logger = logging.getLogger(__name__)
+
 # Prometheus metrics
 DOCS_INGESTED = Counter('docs_ingested_total', 'Number of documents ingested')
 INGEST_LATENCY = Histogram('ingest_latency_seconds', 'Time taken to ingest documents')
 
-def load_mbox(path: Path) -> List[Dict[str, Any]]:
-    """Load and validate emails from mbox file."""
+def _validate_records(records: List[Dict[str, Any]], schema_type: str, offset: int = 0) -> List[Dict[str, Any]]:
+    """Validate records and report quality issues by their index in the file."""
+    validated_records = SchemaValidator.validate_batch(records, schema_type)
+    
+    # Check quality
+    quality_issues = QualityChecker.check_batch_quality(validated_records, schema_type)
+    if quality_issues:
+        for idx, issues in quality_issues.items():
+            print(f"Quality issues in record {offset + idx}:", file=sys.stderr)
+            for issue in issues:
+                print(f"  - {issue}", file=sys.stderr)
+    
+    return validated_records
+
+# Messages parsed per worker task by load_mbox
+MBOX_SHARD_SIZE = 500
+
+def _parse_message(message: mailbox.mboxMessage) -> Dict[str, Any]:
+    """Extract the loader fields from one email message."""
+    record = {
+        'subject': message['subject'] or '',
+        'from': message['from'] or '',
+        'to': message['to'] or '',
+        'date': message['date'] or '',
+        'content': ''
+    }
+    
+    # Handle multipart messages
+    if message.is_multipart():
+        record['content'] = ''.join(
+            part.get_payload(decode=True).decode('utf-8', errors='ignore')
+            for part in message.walk()
+            if part.get_content_type() == 'text/plain'
+        )
+    else:
+        record['content'] = message.get_payload(decode=True).decode('utf-8', errors='ignore')
+    
+    return record
+
+def _parse_shard(path: str, spans: List[tuple]) -> List[Dict[str, Any]]:
+    """Parse the messages stored at the given (start, stop) byte offsets."""
     records = []
-    mbox = mailbox.mbox(str(path))
-    
-    for message in mbox:
-        # Extract email fields
-        record = {
-            'subject': message['subject'] or '',
-            'from': message['from'] or '',
-            'to': message['to'] or '',
-            'date': message['date'] or '',
-            'content': ''
-        }
-        
-        # Handle multipart messages
-        if message.is_multipart():
-            for part in message.walk():
-                if part.get_content_type() == 'text/plain':
-                    record['content'] += part.get_payload(decode=True).decode('utf-8', errors='ignore')
-        else:
-            record['content'] = message.get_payload(decode=True).decode('utf-8', errors='ignore')
+    with open(path, 'rb') as f:
+        for start, stop in spans:
+            f.seek(start)
+            f.readline()  # Skip the "From " separator line
+            message = mailbox.mboxMessage(f.read(stop - f.tell()).replace(os.linesep.encode(), b'\n'))
+            records.append(_parse_message(message))
+    return records
+
+def _index_mbox(path: str) -> List[tuple]:
+    """Find the (start, stop) byte offsets of each message in an mbox file.
+    
+    A message starts at a "From " line and stops before the blank line
+    that precedes the next one, as mailbox.mbox delimits them.
+    """
+    spans = []
+    start = None
+    last_was_empty = False
+    with open(path, 'rb') as f:
+        while True:
+            line_pos = f.tell()
+            line = f.readline()
+            if line.startswith(b'From ') or not line:
+                if start is not None:
+                    stop = line_pos - len(os.linesep) if last_was_empty else line_pos
+                    spans.append((start, stop))
+                if not line:
+                    return spans
+                start = line_pos
+                last_was_empty = False
+            else:
+                last_was_empty = line == os.linesep.encode()
+
+def load_mbox(path: Path, workers: int = 1) -> Iterator[Dict[str, Any]]:
+    """Load emails from mbox file.
+    
+    A single pass indexes the byte offsets of the messages, which are then
+    parsed in shards of MBOX_SHARD_SIZE. With more than one worker the
+    shards are parsed by a pool of spawned processes, in file order; the
+    loader runs in a producer thread, where forking is unsafe.
+    
+    Args:
+        path: Path to the mbox file
+        workers: Number of processes used to parse messages
         
-        records.append(record)
+    Yields:
+        Dictionaries containing the email fields
+    """
+    spans = _index_mbox(str(path))
+    shards = [spans[i:i + MBOX_SHARD_SIZE] for i in range(0, len(spans), MBOX_SHARD_SIZE)]
+    parse_shard = partial(_parse_shard, str(path))
     
-    return records
+    # Spawning processes is not worth it for a single shard
+    if workers <= 1 or len(shards) <= 1:
+        for shard in shards:
+            yield from parse_shard(shard)
+        return
+    
+    with multiprocessing.get_context('spawn').Pool(workers) as pool:
+        yield from chain.from_iterable(pool.imap(parse_shard, shards))
 
-def load_csv(path: Path) -> List[Dict[str, Any]]:
-    """Load and validate records from CSV file."""
-    records = []
-    with open(path, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            records.append(row)
+def load_csv(path: Path) -> Iterator[Dict[str, Any]]:
+    """Load and validate records from CSV file.
+    
+    Rows are parsed by Arrow's multithreaded CSV reader, one block at a
+    time, with every column kept as a string like csv.DictReader does.
+    Each block is validated and yielded before the next one is read. Rows
+    with too few or too many fields, which Arrow rejects, are read by
+    csv.DictReader instead and validated after the block they came with.
+    """
+    with open(path, 'r', newline='') as f:
+        fieldnames = next(csv.reader(f), [])
     
     # Determine schema type from headers
-    if 'po_number' in reader.fieldnames:
+    if 'po_number' in fieldnames:
         schema_type = 'purchase_order'
     else:
         raise ValueError("Unsupported CSV format")
     
-    # Validate records
-    validated_records = SchemaValidator.validate_batch(records, schema_type)
+    ragged_rows = []
     
-    # Check quality
-    quality_issues = QualityChecker.check_batch_quality(validated_records, schema_type)
-    if quality_issues:
-        for idx, issues in quality_issues.items():
-            print(f"Quality issues in record {idx}:", file=sys.stderr)
-            for issue in issues:
-                print(f"  - {issue}", file=sys.stderr)
+    def skip_ragged_row(row) -> str:
+        ragged_rows.append(row.text)
+        return 'skip'
     
-    return validated_records
+    reader = pacsv.open_csv(
+        str(path),
+        parse_options=pacsv.ParseOptions(newlines_in_values=True, invalid_row_handler=skip_ragged_row),
+        convert_options=pacsv.ConvertOptions(column_types={name: pa.string() for name in fieldnames})
+    )
+    offset = 0
+    for batch in reader:
+        records = batch.to_pylist()
+        if ragged_rows:
+            records += csv.DictReader(io.StringIO('\n'.join(ragged_rows)), fieldnames=fieldnames)
+            ragged_rows.clear()
+        yield from _validate_records(records, schema_type, offset)
+        offset += len(records)
 
-def load_parquet(path: Path) -> List[Dict[str, Any]]:
+# Rows converted per Arrow record batch by load_parquet
+PARQUET_LOAD_BATCH_SIZE = 50_000
+
+def _table_to_records(table: pa.Table) -> List[Dict[str, Any]]:
+    """Convert an Arrow table to records, replacing nulls with ''."""
+    # Fill nulls column-wise with Arrow kernels rather than per cell
+    null_columns = []
+    for i, field in enumerate(table.schema):
+        if table.column(i).null_count == 0:
+            continue
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            table = table.set_column(i, field.name, pc.fill_null(table.column(i), ''))
+        else:
+            null_columns.append(field.name)
+    
+    # Convert to list of dictionaries
+    records = table.to_pylist()
+    
+    # Non-string columns cannot hold '' in Arrow, so patch their nulls here
+    if null_columns:
+        for record in records:
+            for col in null_columns:
+                if record[col] is None:
+                    record[col] = ''
+    
+    return records
+
+def load_parquet(path: Path) -> Iterator[Dict[str, Any]]:
     """Load and validate records from Parquet file using pyarrow.
     
     Args:
         path: Path to the Parquet file
         
-    Returns:
-        List of dictionaries containing the records
+    Yields:
+        Dictionaries containing the records, one record batch at a time
     """
-    # Read the Parquet file
-    table = pq.read_table(str(path))
-    
-    # Convert to list of dictionaries
-    records = []
-    for batch in table.to_batches():
-        for i in range(len(batch)):
-            record = {}
-            for col in batch.schema.names:
-                value = batch[col][i].as_py()
-                # Handle null values
-                record[col] = value if value is not None else ''
-            records.append(record)
+    parquet_file = pq.ParquetFile(str(path))
     
     # Determine schema type from column names
-    schema_type = 'purchase_order' if 'po_number' in table.schema.names else 'drive'
+    schema_type = 'purchase_order' if 'po_number' in parquet_file.schema_arrow.names else 'drive'
     
-    # Validate records
-    validated_records = SchemaValidator.validate_batch(records, schema_type)
+    # Convert and validate one record batch at a time so the whole file is
+    # never held as an Arrow table or as Python dicts
+    offset = 0
+    for batch in parquet_file.iter_batches(batch_size=PARQUET_LOAD_BATCH_SIZE):
+        records = _table_to_records(pa.Table.from_batches([batch]))
+        yield from _validate_records(records, schema_type, offset)
+        offset += batch.num_rows
+
+def iter_parquet(path: Path, batch_size: int = 8192) -> Iterator[Dict[str, Any]]:
+    """Stream records from a Parquet file one batch at a time.
     
-    # Check quality
-    quality_issues = QualityChecker.check_batch_quality(validated_records, schema_type)
-    if quality_issues:
-        for idx, issues in quality_issues.items():
-            print(f"Quality issues in record {idx}:", file=sys.stderr)
-            for issue in issues:
-                print(f"  - {issue}", file=sys.stderr)
+    Unlike load_parquet, records are not validated, so only batch_size
+    rows are held in memory at once.
     
-    return validated_records
+    Args:
+        path: Path to the Parquet file
+        batch_size: Maximum number of rows read per batch
+        
+    Yields:
+        Dictionaries containing the records, with nulls replaced by ''
+    """
+    parquet_file = pq.ParquetFile(str(path))
+    for batch in parquet_file.iter_batches(batch_size=batch_size):
+        yield from _table_to_records(pa.Table.from_batches([batch]))
 
-def load_jsonl(path: Path) -> List[Dict[str, Any]]:
-    """Load and validate records from JSONL file."""
-    records = []
-    with open(path, 'r') as f:
+def load_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    """Load records from JSONL file one line at a time, skipping blank lines."""
+    with open(path, 'rb') as f:
         for line in f:
-            records.append(json.loads(line))
-    return records
+            if line.strip():
+                yield orjson.loads(line)
 
 class GDELTHandler(FileSystemEventHandler):
     """Watches for new GDELT data files and processes them."""
@@ -143,8 +269,8 @@ class GDELTHandler(FileSystemEventHandler):
                     # Extract article text
                     text = f"{record.get('title', '')} {record.get('description', '')}"
                     
-                    # Find matching suppliers
-                    supplier_ids = self.alias_map.find_matches(text)
+                    # Find matching suppliers, normalizing the article once
+                    supplier_ids = self.alias_map.find_matches_normalized(AliasMap._normalize(text))
                     
                     if supplier_ids:
                         # Add to Airweave for each matching supplier
@@ -171,71 +297,157 @@ class GDELTHandler(FileSystemEventHandler):
             except Exception as e:
                 print(f"Error processing {event.src_path}: {str(e)}", file=sys.stderr)
 
-def main(args: Optional[list] = None):
-    # Start Prometheus metrics server on a random available port
-    port = 8000
-    while True:
+# Number of documents sampled to estimate the average serialized size
+BATCH_SIZE_SAMPLE = 100
+
+def _effective_batch_size(docs: List[Dict[str, Any]], batch_size: int, max_chunk_bytes: int) -> int:
+    """Cap batch_size so a batch stays under max_chunk_bytes on average."""
+    sample = docs[:BATCH_SIZE_SAMPLE]
+    if not sample:
+        return batch_size
+    avg_doc_size = sum(len(json.dumps(doc, default=str)) for doc in sample) / len(sample)
+    return max(1, min(batch_size, int(max_chunk_bytes // avg_doc_size)))
+
+def _timed_ingest(client: AirweaveClient, collection: str, docs: List[Dict[str, Any]]) -> float:
+    """Ingest one batch of documents and return how long the call took."""
+    start_time = time.time()
+    client.bulk_ingest_batch(collection, docs)
+    return time.time() - start_time
+
+def _iter_batches(records: Iterable[Dict[str, Any]], source: str, collection: str,
+                  batch_size: int, max_chunk_bytes: int) -> Iterator[List[Dict[str, Any]]]:
+    """Convert records to Airweave documents and group them into batches."""
+    # Convert records to format expected by Airweave
+    static_meta = {'source': source, 'collection': collection}
+    docs = (
+        {
+            # Index every field as a "key: value" line
+            'content': '\n'.join(f'{key}: {value}' for key, value in record.items()),
+            'metadata': {**static_meta, **record}  # Include original fields in metadata
+        }
+        for record in records
+    )
+    
+    # Size batches from the first documents, then put them back in front
+    sample = list(islice(docs, BATCH_SIZE_SAMPLE))
+    size = _effective_batch_size(sample, batch_size, max_chunk_bytes)
+    docs = chain(sample, docs)
+    
+    while batch := list(islice(docs, size)):
+        yield batch
+
+def ingest_records(client: AirweaveClient, records: Iterable[Dict[str, Any]], source: str, collection: str,
+                   concurrency: int = 10, batch_size: int = 500, max_chunk_bytes: int = 50 * 1024 * 1024,
+                   queue_size: Optional[int] = None):
+    """Ingest records into an Airweave collection while they are loaded.
+    
+    A producer thread pulls records from the loader, groups them into
+    batches of up to batch_size documents, shrunk so that a batch averages
+    at most max_chunk_bytes of JSON, and puts them on a bounded queue.
+    concurrency consumer threads take batches off the queue and ingest
+    them, so parsing overlaps with ingestion and at most queue_size
+    batches wait in memory. Metrics and the progress bar are updated as
+    batches complete.
+    
+    Args:
+        client: Airweave client to ingest with
+        records: Records yielded by one of the loaders
+        source: Source file format the records came from
+        collection: Target collection name
+        concurrency: Number of consumer threads ingesting batches
+        batch_size: Maximum number of documents per ingest call
+        max_chunk_bytes: Target upper bound on the serialized size of a batch
+        queue_size: Maximum number of batches waiting to be ingested,
+            defaults to 4 * concurrency
+        
+    Raises:
+        Any exception raised by the loader, after queued batches are ingested
+    """
+    batches = queue.Queue(maxsize=queue_size or 4 * concurrency)
+    load_errors = []
+    
+    def produce():
         try:
-            start_http_server(port)
-            break
-        except OSError:
-            port += 1
-            if port > 9000:  # Max port to try
-                raise
+            for batch in _iter_batches(records, source, collection, batch_size, max_chunk_bytes):
+                batches.put(batch)
+        except Exception as e:
+            load_errors.append(e)
+        finally:
+            # One sentinel per consumer signals the end of the input
+            for _ in range(concurrency):
+                batches.put(None)
+    
+    def consume(pbar):
+        while (batch := batches.get()) is not None:
+            try:
+                latency = _timed_ingest(client, collection, batch)
+            except Exception as e:
+                print(f"Error ingesting batch of {len(batch)} records: {str(e)}", file=sys.stderr)
+                continue
+            
+            # Update Prometheus metrics
+            DOCS_INGESTED.inc(len(batch))
+            INGEST_LATENCY.observe(latency)
+            
+            pbar.update(len(batch))
+    
+    # Show progress bar during ingestion
+    with tqdm.tqdm(desc="Ingesting") as pbar:
+        threads = [threading.Thread(target=produce, name="ingest-producer")]
+        threads += [threading.Thread(target=consume, args=(pbar,), name=f"ingest-consumer-{i}")
+                    for i in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
     
+    if load_errors:
+        raise load_errors[0]
+
+def main(args: Optional[list] = None):
     parser = argparse.ArgumentParser(description="Bulk data loader for Airweave")
     parser.add_argument("--source", choices=["mbox", "csv", "parquet"], required=True,
                       help="Source file format")
     parser.add_argument("--collection", required=True,
                       help="Target collection name")
+    parser.add_argument("--concurrency", type=int, default=10,
+                      help="Number of concurrent ingest calls")
+    parser.add_argument("--batch-size", type=int, default=500,
+                      help="Maximum number of documents per ingest call")
+    parser.add_argument("--max-chunk-bytes", type=int, default=50 * 1024 * 1024,
+                      help="Target maximum serialized size of one ingest call")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 1) - 1),
+                      help="Number of processes parsing mbox messages")
+    parser.add_argument("--queue-size", type=int, default=None,
+                      help="Maximum number of loaded batches waiting to be ingested (default: 4 x concurrency)")
+    parser.add_argument("--metrics-port", type=int, default=0,
+                      help="Port for the Prometheus metrics server (default: any free port)")
     parser.add_argument("file", type=Path,
                       help="Input file path")
     
     args = parser.parse_args(args)
     
+    logging.basicConfig(level=logging.INFO)
+    
+    # Start Prometheus metrics server; port 0 lets the kernel pick a free one
+    server, _ = start_http_server(args.metrics_port)
+    logger.info("Serving Prometheus metrics on port %d", server.server_port)
+    
     # Initialize client
     client = AirweaveClient()
     
     # Load data based on source type
     loaders = {
-        "mbox": load_mbox,
+        "mbox": partial(load_mbox, workers=args.workers),
         "csv": load_csv,
         "parquet": load_parquet
     }
     
     try:
         loader = loaders[args.source]
-        records = loader(args.file)
+        ingest_records(client, loader(args.file), args.source, args.collection,
+                       args.concurrency, args.batch_size, args.max_chunk_bytes, args.queue_size)
         
-        # Show progress bar during ingestion
-        with tqdm.tqdm(total=len(records), desc="Ingesting") as pbar:
-            for record in records:
-                start_time = time.time()
-                
-                try:
-                    # Convert record to format expected by Airweave
-                    doc = {
-                        'content': str(record),  # Convert entire record to string for indexing
-                        'metadata': {
-                            'source': args.source,
-                            'collection': args.collection,
-                            **record  # Include original fields in metadata
-                        }
-                    }
-                    
-                    # Ingest document
-                    client.bulk_ingest(args.collection, doc)
-                    
-                    # Update Prometheus metrics
-                    DOCS_INGESTED.inc()
-                    INGEST_LATENCY.observe(time.time() - start_time)
-                    
-                except Exception as e:
-                    print(f"Error ingesting record: {str(e)}", file=sys.stderr)
-                    continue
-                
-                pbar.update(1)
-                
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
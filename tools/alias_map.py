@@ -1,12 +1,23 @@
 """Supplier alias mapping for external news matching."""
 import re
-from typing import Dict, Set
+from typing import Dict, Optional, Set
+import ahocorasick
+
+# Characters that are neither word characters nor whitespace
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# Same replacement for ASCII text, without going through the regex engine
+_ASCII_PUNCT_TRANS = str.maketrans({
+    chr(code): ' ' for code in range(128) if _PUNCT_RE.match(chr(code))
+})
 
 class AliasMap:
     """Maps supplier IDs to their name aliases for news matching."""
     
     def __init__(self):
         self._aliases: Dict[str, Set[str]] = {}
+        # Built lazily from _aliases; None means it needs rebuilding
+        self._automaton: Optional[ahocorasick.Automaton] = None
         
     def add_supplier(self, supplier_id: str, name: str, aliases: Set[str] = None):
         """
@@ -21,6 +32,22 @@ class AliasMap:
             aliases = set()
         aliases.add(name)  # Add primary name to aliases
         self._aliases[supplier_id] = {self._normalize(a) for a in aliases}
+        self._automaton = None
+        
+    def _build_automaton(self) -> ahocorasick.Automaton:
+        """Build an Aho-Corasick automaton mapping each alias to its supplier IDs."""
+        supplier_ids_by_alias: Dict[str, Set[str]] = {}
+        for supplier_id, aliases in self._aliases.items():
+            for alias in aliases:
+                if alias:
+                    supplier_ids_by_alias.setdefault(alias, set()).add(supplier_id)
+        
+        automaton = ahocorasick.Automaton()
+        for alias, supplier_ids in supplier_ids_by_alias.items():
+            automaton.add_word(alias, frozenset(supplier_ids))
+        if supplier_ids_by_alias:
+            automaton.make_automaton()
+        return automaton
         
     def find_matches(self, text: str) -> Set[str]:
         """
@@ -32,22 +59,37 @@ class AliasMap:
         Returns:
             Set of matching supplier IDs
         """
-        text = self._normalize(text)
-        matches = set()
+        return self.find_matches_normalized(self._normalize(text))
         
-        for supplier_id, aliases in self._aliases.items():
-            if any(alias in text for alias in aliases):
-                matches.add(supplier_id)
+    def find_matches_normalized(self, normalized_text: str) -> Set[str]:
+        """
+        Find supplier IDs whose aliases match already normalized text.
         
+        Args:
+            normalized_text: Text passed through _normalize by the caller
+            
+        Returns:
+            Set of matching supplier IDs
+        """
+        if self._automaton is None:
+            self._automaton = self._build_automaton()
+        if self._automaton.kind != ahocorasick.AHOCORASICK:
+            return set()
+        
+        # One pass over the text reports every alias occurring in it
+        matches = set()
+        for _, supplier_ids in self._automaton.iter(normalized_text):
+            matches.update(supplier_ids)
         return matches
     
     @staticmethod
     def _normalize(text: str) -> str:
         """Normalize text for matching."""
-        # Convert to lowercase
+        # Convert to lowercase and remove special characters
         text = text.lower()
-        # Remove special characters
-        text = re.sub(r'[^\w\s]', ' ', text)
+        if text.isascii():
+            text = text.translate(_ASCII_PUNCT_TRANS)
+        else:
+            text = _PUNCT_RE.sub(' ', text)
         # Normalize whitespace
-        text = ' '.join(text.split())
-        return text
+        return ' '.join(text.split())
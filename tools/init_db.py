@@ -2,6 +2,7 @@
 import argparse
 import asyncio
 import logging
+from itertools import islice
 from typing import List
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
@@ -12,6 +13,9 @@ from services.context_provider import supplier_table
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Rows sent per executemany INSERT when seeding
+INSERT_BATCH_SIZE = 1000
+
 async def init_db(db_url: str, sample_data: bool = True):
     """Initialize database and optionally add sample data."""
     logger.info("Connecting to database at %s", db_url)
@@ -55,10 +59,10 @@ async def init_db(db_url: str, sample_data: bool = True):
         
         async with async_session() as session:
             logger.info("Adding sample suppliers")
-            for supplier in sample_suppliers:
-                await session.execute(
-                    supplier_table.insert().values(supplier)
-                )
+            # One executemany round trip per batch instead of one per row
+            rows = iter(sample_suppliers)
+            while batch := list(islice(rows, INSERT_BATCH_SIZE)):
+                await session.execute(supplier_table.insert(), batch)
             await session.commit()
             
         logger.info("Sample data loaded successfully!")
@@ -10,6 +10,51 @@ from sentence_transformers import SentenceTransformer
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Payload fields indexed for efficient filtering
+_PAYLOAD_INDEXES = [
+    ("metadata.supplier_id", models.PayloadSchemaType.KEYWORD),
+    ("metadata.collection", models.PayloadSchemaType.KEYWORD),
+    ("metadata.published", models.PayloadSchemaType.DATETIME),
+    ("metadata.timestamp", models.PayloadSchemaType.DATETIME)
+]
+
+# Texts embedded per encoder forward pass
+ENCODE_BATCH_SIZE = 64
+
+# Points per upload request and number of parallel uploaders; uploads
+# only go parallel when every uploader gets at least one full batch
+UPLOAD_BATCH_SIZE = 32
+UPLOAD_PARALLEL = 4
+
+def upload_documents(client: QdrantClient, collection_name: str, encoder, docs: list, start_id: int = 1):
+    """Encode documents and upload them in batches.
+    
+    Args:
+        client: Qdrant client to upload with
+        collection_name: Target collection
+        encoder: Sentence transformer used to embed each document's content
+        docs: Payloads to upload, each with a "content" field
+        start_id: Point id of the first document
+    """
+    # Unit-length vectors, so the cosine distance reduces to a dot product
+    vectors = encoder.encode(
+        [doc["content"] for doc in docs],
+        batch_size=ENCODE_BATCH_SIZE,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=len(docs) > ENCODE_BATCH_SIZE
+    )
+    client.upload_points(
+        collection_name=collection_name,
+        points=(
+            models.PointStruct(id=point_id, vector=vector.tolist(), payload=doc)
+            for point_id, (doc, vector) in enumerate(zip(docs, vectors), start=start_id)
+        ),
+        batch_size=UPLOAD_BATCH_SIZE,
+        parallel=UPLOAD_PARALLEL if len(docs) >= UPLOAD_BATCH_SIZE * UPLOAD_PARALLEL else 1,
+        wait=True
+    )
+
 def setup_collections(
     qdrant_url: str,
     recreate: bool = False,
@@ -53,29 +98,12 @@ def setup_collections(
     )
     
     # Create payload index for efficient filtering
-    client.create_payload_index(
-        collection_name=collection_name,
-        field_name="metadata.supplier_id",
-        field_schema=models.PayloadSchemaType.KEYWORD
-    )
-    
-    client.create_payload_index(
-        collection_name=collection_name,
-        field_name="metadata.collection",
-        field_schema=models.PayloadSchemaType.KEYWORD
-    )
-    
-    client.create_payload_index(
-        collection_name=collection_name,
-        field_name="metadata.published",
-        field_schema=models.PayloadSchemaType.DATETIME
-    )
-    
-    client.create_payload_index(
-        collection_name=collection_name,
-        field_name="metadata.timestamp",
-        field_schema=models.PayloadSchemaType.DATETIME
-    )
+    for field_name, field_schema in _PAYLOAD_INDEXES:
+        client.create_payload_index(
+            collection_name=collection_name,
+            field_name=field_name,
+            field_schema=field_schema
+        )
     
     # Add example document for testing
     test_doc = {
@@ -90,18 +118,8 @@ def setup_collections(
         }
     }
     
-    # Encode and upsert test document
-    vector = encoder.encode(test_doc["content"]).tolist()
-    client.upsert(
-        collection_name=collection_name,
-        points=[
-            models.PointStruct(
-                id=1,
-                vector=vector,
-                payload=test_doc
-            )
-        ]
-    )
+    # Encode and upload test document
+    upload_documents(client, collection_name, encoder, [test_doc])
     
     logger.info("Collection setup complete!")
     logger.info("Collection info:")
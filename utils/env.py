@@ -1,11 +1,30 @@
 """Environment variable utilities."""
 
 import os
-from typing import Optional
+from typing import Dict, Optional
+
+# Values already read by get_env_var; unset variables are not cached
+_ENV_CACHE: Dict[str, str] = {}
+
+def _read_env(key: str) -> Optional[str]:
+    """Read a variable from the environment, caching it once it is set."""
+    value = _ENV_CACHE.get(key)
+    if value is None:
+        value = os.getenv(key)
+        if value:
+            _ENV_CACHE[key] = value
+    return value
+
+def clear_env_cache() -> None:
+    """Forget cached values so the next lookups re-read the environment."""
+    _ENV_CACHE.clear()
 
 def get_env_var(key: str, required: bool = True) -> str:
     """Get an environment variable value.
 
+    Values are read from the environment once and then served from a
+    cache; call clear_env_cache() after changing the environment.
+
     Args:
         key: The environment variable name
         required: If True, raises RuntimeError if variable is not set
@@ -16,7 +35,7 @@ def get_env_var(key: str, required: bool = True) -> str:
     Raises:
         RuntimeError: If required is True and the variable is not set
     """
-    value = os.getenv(key)
+    value = _read_env(key)
     if required and not value:
         raise RuntimeError(f"Required environment variable '{key}' is not set")
     return value
@@ -1,11 +1,28 @@
 """Data quality checks for ingested data."""
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from datetime import datetime
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once rather than per checked item
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_MIME_RE = re.compile(r'^[\w-]+/[\w-]+$')
+_PO_RE = re.compile(r'^PO\d{3,}$')
+
+# Allowed purchase order statuses
+_PO_STATUSES = frozenset({'pending', 'approved', 'rejected'})
+
+def _is_iso_datetime(value: str) -> bool:
+    """Check that a string is an ISO 8601 date or timestamp."""
+    try:
+        # Python 3.11's C parser accepts the trailing 'Z' itself
+        datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
 class QualityChecker:
     """Performs data quality checks on ingested data."""
     
@@ -23,8 +40,7 @@ class QualityChecker:
         issues = []
         
         # Check email format
-        email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-        if 'from' in data and not email_pattern.match(data['from']):
+        if 'from' in data and not _EMAIL_RE.match(data['from']):
             issues.append(f"Invalid 'from' email format: {data['from']}")
         
         # Check content length
@@ -32,10 +48,7 @@ class QualityChecker:
             issues.append("Content too short (< 10 chars)")
         
         # Check date
-        try:
-            if isinstance(data.get('date'), str):
-                datetime.fromisoformat(data['date'].replace('Z', '+00:00'))
-        except (ValueError, TypeError):
+        if isinstance(data.get('date'), str) and not _is_iso_datetime(data['date']):
             issues.append(f"Invalid date format: {data.get('date')}")
         
         return issues
@@ -59,15 +72,12 @@ class QualityChecker:
         
         # Check mime type format
         mime_type = data.get('mime_type', '')
-        if not re.match(r'^[\w-]+/[\w-]+$', mime_type):
+        if not _MIME_RE.match(mime_type):
             issues.append(f"Invalid mime type format: {mime_type}")
         
         # Check timestamps
         for field in ['created_time', 'modified_time']:
-            try:
-                if isinstance(data.get(field), str):
-                    datetime.fromisoformat(data[field].replace('Z', '+00:00'))
-            except (ValueError, TypeError, KeyError):
+            if isinstance(data.get(field), str) and not _is_iso_datetime(data[field]):
                 issues.append(f"Invalid {field} format: {data.get(field)}")
         
         return issues
@@ -86,7 +96,7 @@ class QualityChecker:
         issues = []
         
         # Check PO number format
-        if not re.match(r'^PO\d{3,}$', data.get('po_number', '')):
+        if not _PO_RE.match(data.get('po_number', '')):
             issues.append(f"Invalid PO number format: {data.get('po_number')}")
         
         # Check amount
@@ -95,24 +105,16 @@ class QualityChecker:
             issues.append(f"Invalid total amount: {amount}")
         
         # Check status
-        valid_statuses = {'pending', 'approved', 'rejected'}
-        if data.get('status') not in valid_statuses:
+        if data.get('status') not in _PO_STATUSES:
             issues.append(f"Invalid status: {data.get('status')}")
         
         return issues
 
     @classmethod
-    def check_quality(cls, data: Dict[str, Any], data_type: str) -> List[str]:
+    def _get_checker(cls, data_type: str) -> Callable[[Dict[str, Any]], List[str]]:
         """
-        Check quality of data based on its type.
+        Resolve the quality check function for a data type.
         
-        Args:
-            data: Dictionary containing the data
-            data_type: Type of data to check
-            
-        Returns:
-            List of quality issues found
-            
         Raises:
             ValueError: If data_type is not supported
         """
@@ -125,7 +127,24 @@ class QualityChecker:
         if data_type not in checkers:
             raise ValueError(f"Unsupported data type: {data_type}")
         
-        return checkers[data_type](data)
+        return checkers[data_type]
+
+    @classmethod
+    def check_quality(cls, data: Dict[str, Any], data_type: str) -> List[str]:
+        """
+        Check quality of data based on its type.
+        
+        Args:
+            data: Dictionary containing the data
+            data_type: Type of data to check
+            
+        Returns:
+            List of quality issues found
+            
+        Raises:
+            ValueError: If data_type is not supported
+        """
+        return cls._get_checker(data_type)(data)
 
     @classmethod
     def check_batch_quality(cls, data_list: List[Dict[str, Any]], data_type: str) -> Dict[int, List[str]]:
@@ -138,10 +157,9 @@ class QualityChecker:
             
         Returns:
             Dictionary mapping item indices to their quality issues
+            
+        Raises:
+            ValueError: If data_type is not supported
         """
-        issues = {}
-        for i, item in enumerate(data_list):
-            item_issues = cls.check_quality(item, data_type)
-            if item_issues:
-                issues[i] = item_issues
-        return issues
+        checker = cls._get_checker(data_type)
+        return {i: item_issues for i, item in enumerate(data_list) if (item_issues := checker(item))}
@@ -1,16 +1,39 @@
 """Qdrant vector store integration for Airweave."""
+import uuid
+from functools import lru_cache
 from typing import List, Dict, Optional
 import numpy as np
 from qdrant_client import QdrantClient
 
 
+@lru_cache(maxsize=8)
+def _get_client(url: str) -> QdrantClient:
+    """Create one client per URL, talking gRPC so vectors travel as packed floats."""
+    return QdrantClient(url=url, prefer_grpc=True, grpc_port=6334, timeout=10.0)
+
 def get_qdrant_client() -> QdrantClient:
     """Get Qdrant client instance."""
-    return QdrantClient(url="http://qdrant:6333")
+    return _get_client("http://qdrant:6333")
 from qdrant_client.http import models
 from sentence_transformers import SentenceTransformer
 from processors.text import ProcessedChunk
 
+# Namespace for deterministic chunk point IDs
+_POINT_ID_NAMESPACE = uuid.UUID('97dad649-957c-44a9-91fa-c2185f04289a')
+
+# Texts embedded per encoder forward pass
+ENCODE_BATCH_SIZE = 64
+
+# Search the int8 quantized vectors, then rescore the top hits with the originals
+SEARCH_PARAMS = models.SearchParams(
+    quantization=models.QuantizationSearchParams(rescore=True)
+)
+
+@lru_cache(maxsize=None)
+def _load_model(model_name: str) -> SentenceTransformer:
+    """Load a sentence transformer once per process and share it between stores."""
+    return SentenceTransformer(model_name)
+
 class QdrantStore:
     """Vector store implementation using Qdrant."""
     
@@ -20,9 +43,10 @@ class QdrantStore:
         collection_name: str = "kb_vectors",
         model_name: str = "all-MiniLM-L6-v2"
     ):
-        self.client = QdrantClient(url=url)
+        self.client = _get_client(url)
         self.collection_name = collection_name
-        self.model = SentenceTransformer(model_name)
+        self.model = _load_model(model_name)
+        self._device = self.model.device
         
         # Ensure collection exists
         self._create_collection_if_not_exists()
@@ -37,51 +61,97 @@ class QdrantStore:
                 collection_name=self.collection_name,
                 vectors_config=models.VectorParams(
                     size=self.model.get_sentence_embedding_dimension(),
-                    distance=models.Distance.COSINE
-                )
+                    distance=models.Distance.COSINE,
+                    on_disk=True  # Full-precision vectors are only read for rescoring
+                ),
+                quantization_config=models.ScalarQuantization(
+                    scalar=models.ScalarQuantizationConfig(
+                        type=models.ScalarType.INT8,
+                        always_ram=True
+                    )
+                ),
+                on_disk_payload=True  # Chunk texts stay on disk until a hit is read
+            )
+        
+        # Filter fields are indexed so filtered search uses the payload index
+        # instead of reading payloads; this is a no-op for existing indexes
+        # and backfills collections created before they were added
+        for field_name in ("source_type", "source_id"):
+            self.client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name=field_name,
+                field_schema=models.PayloadSchemaType.KEYWORD
             )
     
     def _generate_embedding(self, text: str) -> np.ndarray:
         """Generate embedding for text."""
         return self.model.encode(text)
     
+    def _generate_embeddings_batch(self, texts: List[str]) -> np.ndarray:
+        """Generate normalized embeddings for many texts.
+        
+        Embeddings stay on the model's device for the whole encode and are
+        copied to host memory once, as a single float32 array.
+        """
+        embeddings = self.model.encode(
+            texts,
+            batch_size=ENCODE_BATCH_SIZE,
+            convert_to_tensor=True,
+            device=self._device,
+            normalize_embeddings=True
+        )
+        return embeddings.cpu().numpy()
+    
     def index_chunk(self, chunk: ProcessedChunk):
         """Index a processed chunk."""
-        # Generate embedding
-        embedding = self._generate_embedding(chunk.text)
-        
-        # Prepare payload
-        payload = {
-            "text": chunk.text,
-            "metadata": chunk.metadata,
-            "source_id": chunk.metadata.get("id", ""),
-            "source_type": chunk.metadata.get("source", "")
-        }
-        
-        # Index in Qdrant
-        self.client.upsert(
+        self.index_chunks([chunk])
+    
+    def index_chunks(self, chunks: List[ProcessedChunk], wait: bool = True):
+        """Index processed chunks with one encoder call and one upload.
+        
+        Args:
+            chunks: Processed chunks to index
+            wait: If True, return once Qdrant has applied the upload, so the
+                chunks are searchable and write errors are raised here
+        """
+        if not chunks:
+            return
+        
+        # Generate embeddings for all chunks at once
+        embeddings = self._generate_embeddings_batch([chunk.text for chunk in chunks])
+        
+        # Same source chunk, same point ID in every process, so re-indexing
+        # overwrites points instead of duplicating them
+        ids = [
+            str(uuid.uuid5(
+                _POINT_ID_NAMESPACE,
+                f"{chunk.metadata.get('id', '')}:{chunk.metadata.get('chunk_index', 0)}"
+            ))
+            for chunk in chunks
+        ]
+        payloads = [
+            {
+                "text": chunk.text,
+                "metadata": chunk.metadata,
+                "source_id": chunk.metadata.get("id", ""),
+                "source_type": chunk.metadata.get("source", "")
+            }
+            for chunk in chunks
+        ]
+        
+        # Index in Qdrant, passing the float32 array without converting it
+        # to lists of Python floats first
+        self.client.upload_collection(
             collection_name=self.collection_name,
-            points=[
-                models.PointStruct(
-                    id=hash(f"{chunk.metadata.get('id', '')}_{chunk.metadata.get('chunk_index', 0)}"),
-                    vector=embedding.tolist(),
-                    payload=payload
-                )
-            ]
+            vectors=embeddings.astype(np.float32, copy=False),
+            payload=payloads,
+            ids=ids,
+            wait=wait
         )
     
-    def search(
-        self,
-        query: str,
-        limit: int = 5,
-        source_type: Optional[str] = None,
-        source_id: Optional[str] = None
-    ) -> List[Dict]:
-        """Search for similar chunks."""
-        # Generate query embedding
-        query_vector = self._generate_embedding(query)
-        
-        # Prepare filters
+    @staticmethod
+    def _build_filter(source_type: Optional[str], source_id: Optional[str]) -> Optional[models.Filter]:
+        """Build a payload filter on source type and ID, if any are given."""
         filter_conditions = []
         if source_type:
             filter_conditions.append(
@@ -97,23 +167,109 @@ class QdrantStore:
                     match=models.MatchValue(value=source_id)
                 )
             )
+        return models.Filter(must=filter_conditions) if filter_conditions else None
+    
+    @staticmethod
+    def _payload_selector(include_text: bool):
+        """Select the hit payload, leaving out the chunk text if not needed."""
+        return True if include_text else models.PayloadSelectorExclude(exclude=["text"])
+    
+    @staticmethod
+    def _format_hits(hits) -> List[Dict]:
+        """Format search hits as result dictionaries."""
+        results = []
+        for hit in hits:
+            result = {"id": hit.id}
+            if "text" in hit.payload:
+                result["text"] = hit.payload["text"]
+            result["metadata"] = hit.payload["metadata"]
+            result["score"] = hit.score
+            results.append(result)
+        return results
+    
+    def fetch_texts(self, ids: List) -> Dict:
+        """Fetch the chunk texts of search hits returned without them.
+        
+        Args:
+            ids: Point IDs taken from the "id" field of search results
+            
+        Returns:
+            Dictionary mapping each found point ID to its chunk text
+        """
+        if not ids:
+            return {}
+        
+        points = self.client.retrieve(
+            collection_name=self.collection_name,
+            ids=ids,
+            with_payload=["text"],
+            with_vectors=False
+        )
+        return {point.id: point.payload["text"] for point in points}
+    
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        source_type: Optional[str] = None,
+        source_id: Optional[str] = None,
+        include_text: bool = True
+    ) -> List[Dict]:
+        """Search for similar chunks.
+        
+        With include_text=False, hits leave out the chunk text. Use
+        fetch_texts to load it only for the hits that are displayed.
+        """
+        # Generate query embedding
+        query_vector = self._generate_embedding(query)
         
         # Search
         results = self.client.search(
             collection_name=self.collection_name,
-            query_vector=query_vector.tolist(),
+            query_vector=query_vector.astype(np.float32, copy=False),
             limit=limit,
-            query_filter=models.Filter(
-                must=filter_conditions
-            ) if filter_conditions else None
+            query_filter=self._build_filter(source_type, source_id),
+            search_params=SEARCH_PARAMS,
+            with_payload=self._payload_selector(include_text)
         )
         
         # Format results
-        return [
-            {
-                "text": hit.payload["text"],
-                "metadata": hit.payload["metadata"],
-                "score": hit.score
-            }
-            for hit in results
-        ]
+        return self._format_hits(results)
+    
+    def search_batch(
+        self,
+        queries: List[str],
+        limit: int = 5,
+        source_type: Optional[str] = None,
+        source_id: Optional[str] = None,
+        include_text: bool = True
+    ) -> List[List[Dict]]:
+        """Search for similar chunks for several queries in one request."""
+        if not queries:
+            return []
+        
+        # Generate all query embeddings at once
+        query_vectors = self.model.encode(
+            queries,
+            batch_size=ENCODE_BATCH_SIZE,
+            convert_to_numpy=True
+        )
+        query_filter = self._build_filter(source_type, source_id)
+        
+        # Search
+        results = self.client.search_batch(
+            collection_name=self.collection_name,
+            requests=[
+                models.SearchRequest(
+                    vector=query_vector.tolist(),
+                    limit=limit,
+                    filter=query_filter,
+                    params=SEARCH_PARAMS,
+                    with_payload=self._payload_selector(include_text)
+                )
+                for query_vector in query_vectors
+            ]
+        )
+        
+        # Format results
+        return [self._format_hits(hits) for hits in results]